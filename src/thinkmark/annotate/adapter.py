@@ -5,6 +5,7 @@ This module provides functions that adapt the existing annotation functionality
 to work with the new pipeline architecture.
 """
 
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import logging
@@ -16,13 +17,19 @@ from thinkmark.core.models import Document, PipelineState
 logger = logging.getLogger(__name__)
 
 
-def get_document_context(state: PipelineState, doc: Document) -> Dict[str, Any]:
+def get_document_context(
+    state: PipelineState,
+    doc: Document,
+    docs_by_parent: Optional[Dict[str, List[Document]]] = None
+) -> Dict[str, Any]:
     """
     Get relevant context for a document based on its position in the hierarchy.
     
     Args:
         state: Current pipeline state
         doc: Document to get context for
+        docs_by_parent: Optional index of state's documents grouped by parent_id;
+            when given, siblings are looked up in it instead of scanning state
         
     Returns:
         Dictionary with parent, siblings, and children information
@@ -45,8 +52,12 @@ def get_document_context(state: PipelineState, doc: Document) -> Dict[str, Any]:
     
     # Find siblings
     if doc.parent_id:
-        for other_id, other_doc in state.documents.items():
-            if other_doc.parent_id == doc.parent_id and other_id != doc.id:
+        if docs_by_parent is not None:
+            candidates = docs_by_parent.get(doc.parent_id, ())
+        else:
+            candidates = state.documents.values()
+        for other_doc in candidates:
+            if other_doc.parent_id == doc.parent_id and other_doc.id != doc.id:
                 context["siblings"].append({
                     "title": other_doc.title,
                     "url": other_doc.url
@@ -64,7 +75,12 @@ def get_document_context(state: PipelineState, doc: Document) -> Dict[str, Any]:
     return context
 
 
-def process_document(state: PipelineState, doc: Document, api_key: str) -> Document:
+def process_document(
+    state: PipelineState,
+    doc: Document,
+    api_key: str,
+    docs_by_parent: Optional[Dict[str, List[Document]]] = None
+) -> Document:
     """
     Annotate a document with LLM.
     
@@ -72,6 +88,7 @@ def process_document(state: PipelineState, doc: Document, api_key: str) -> Docum
         state: Current pipeline state
         doc: Document to annotate
         api_key: API key for LLM service
+        docs_by_parent: Optional index of state's documents grouped by parent_id
         
     Returns:
         Annotated document
@@ -81,7 +98,7 @@ def process_document(state: PipelineState, doc: Document, api_key: str) -> Docum
         return doc
     
     # Get document context from hierarchy
-    context = get_document_context(state, doc)
+    context = get_document_context(state, doc, docs_by_parent)
     
     try:
         # Annotate the document
@@ -134,10 +151,13 @@ def process_state(state: PipelineState, api_key: str) -> PipelineState:
     new_state = PipelineState(state.site_url, state.output_dir)
     new_state.hierarchy = state.hierarchy
     
-    # Process each document
+    # Process each document, keeping the annotated documents grouped by parent
+    # so sibling lookups don't rescan the whole state for every document
+    docs_by_parent = defaultdict(list)
     for doc_id, doc in state.documents.items():
-        annotated_doc = process_document(new_state, doc, api_key)
+        annotated_doc = process_document(new_state, doc, api_key, docs_by_parent)
         new_state.add_document(annotated_doc)
+        docs_by_parent[annotated_doc.parent_id].append(annotated_doc)
     
     # Rebuild hierarchy (in case any issues)
     new_state.build_hierarchy()
@@ -1,7 +1,8 @@
 """LLM client for document annotation."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from openai import OpenAI
-from dotenv import load_dotenv
 import os
 import json
 import jsonlines
@@ -10,6 +11,13 @@ from tqdm import tqdm
 from typing import Any, Dict, List, Optional, Union
 
 from thinkmark.utils.json_io import load_json, load_jsonl, save_json, save_jsonl
+from thinkmark.utils.text import escape_rich_tags
+
+# System prompt shared by every summarization request
+SUMMARY_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "Describe this documentation page in 1-2 sentence summary for an index. If it does not contain useful information for a developer agent, respond with FAIL."
+}
 
 
 class LLMClient:
@@ -43,8 +51,7 @@ class LLMClient:
         """Summarize a markdown document via OpenRouter."""
         model_to_use = model or self.model
         messages = [
-            {"role": "system",
-             "content": "Describe this documentation page in 1-2 sentence summary for an index. If it does not contain useful information for a developer agent, respond with FAIL."},
+            SUMMARY_SYSTEM_MESSAGE,
             {"role": "user", "content": markdown_content}
         ]
         return self.client.chat.completions.create(
@@ -54,6 +61,12 @@ class LLMClient:
         )
 
 
+@lru_cache(maxsize=8)
+def _get_llm_client(api_key: Optional[str] = None) -> LLMClient:
+    """Return a shared LLMClient per API key so its HTTP connection pool is reused."""
+    return LLMClient(api_key=api_key)
+
+
 def process_document(
     markdown_content: str,
     url: str,
@@ -74,8 +87,8 @@ def process_document(
     Returns:
         Annotated Markdown content
     """
-    # Initialize LLM client
-    llm_client = LLMClient(api_key=api_key)
+    # Reuse the LLM client across documents
+    llm_client = _get_llm_client(api_key)
     
     # Create a document summary using the LLM
     try:
@@ -105,24 +118,118 @@ def process_document(
     frontmatter += f"summary: \"{summary.replace('"', '\"')}\"\n---\n\n"
     
     # Escape Rich formatting tags in the content to prevent markup errors
-    # Common Rich formatting tags that might appear in markdown code blocks
-    rich_tags = ['[bold]', '[/bold]', '[italic]', '[/italic]', '[code]', '[/code]', 
-                '[red]', '[/red]', '[green]', '[/green]', '[blue]', '[/blue]']
-    
-    escaped_content = markdown_content
-    for tag in rich_tags:
-        escaped_content = escaped_content.replace(tag, '\\' + tag)
+    escaped_content = escape_rich_tags(markdown_content)
     
     # Return the annotated content with escaped Rich formatting
     return frontmatter + escaped_content
 
 
+def _annotate_entry(
+    entry: Dict[str, Any],
+    input_dir: Path,
+    output_dir: Path,
+    llm_client: Optional[LLMClient]
+) -> Optional[Dict[str, Any]]:
+    """
+    Annotate the Markdown file of one URLs map entry and write it to output_dir.
+    
+    Returns:
+        The updated URLs map entry, or None if the file could not be processed
+    """
+    try:
+        # Get Markdown file path from entry
+        md_file = entry.get('file', '')
+        if not md_file:
+            print(f"Warning: Missing file path in entry: {entry}")
+            return None
+        
+        # Make sure it has the right extension
+        if not md_file.endswith('.md'):
+            md_file = md_file.replace('.html', '.md')
+            if not md_file.endswith('.md'):
+                md_file = f"{md_file}.md"
+        
+        # Handle case where file path already includes a directory prefix
+        # that might conflict with input_dir
+        if md_file.startswith('raw_html/') and 'raw_html' in str(md_file):
+            # Try with the raw_html/ prefix removed
+            clean_md_file = md_file.replace('raw_html/', '', 1)
+            # Also replace .html with .md if needed
+            clean_md_file = clean_md_file.replace('.html', '.md')
+            # Try just the filename part
+            base_md_file = Path(clean_md_file).name
+        else:
+            clean_md_file = md_file
+            base_md_file = Path(md_file).name
+        
+        # Try different path combinations
+        possible_paths = [
+            input_dir / md_file,                # Original path
+            input_dir / clean_md_file,         # Path with prefix removed
+            input_dir / base_md_file,          # Just the filename
+            Path(str(input_dir).rstrip('/markdown')) / md_file  # Alternative base path
+        ]
+        
+        # Find the first path that exists
+        md_path = None
+        for path in possible_paths:
+            if path.exists():
+                md_path = path
+                break
+        
+        # Check if any file exists
+        if not md_path:
+            print(f"Error processing {md_file}: File not found at any of {possible_paths}")
+            return None
+        
+        # Read Markdown content
+        with open(md_path, 'r', encoding='utf-8') as f:
+            markdown_content = f.read()
+        
+        # Get LLM summary if client is available
+        summary = None
+        if llm_client:
+            try:
+                response = llm_client.summarize_markdown(markdown_content[:4000])  # Limit context size
+                summary = response.choices[0].message.content
+                if summary.strip().upper() == "FAIL":
+                    summary = None
+            except Exception as e:
+                print(f"Error getting summary for {md_file}: {str(e)}")
+        
+        # Create new content with summary if available
+        if summary:
+            annotated_content = f"## Summary\n\n{summary}\n\n---\n\n{markdown_content}"
+        else:
+            annotated_content = markdown_content
+        
+        # Create output path - maintain directory structure
+        output_path = output_dir / md_file
+        
+        # Create parent directories if needed
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write annotated content as one encoded buffer
+        output_path.write_bytes(annotated_content.encode('utf-8'))
+        
+        # Update URLs map entry
+        new_entry = entry.copy()
+        if summary:
+            new_entry['summary'] = summary
+        return new_entry
+        
+    except Exception as e:
+        print(f"Error processing {entry.get('file', 'unknown file')}: {str(e)}")
+        return None
+
+
 def annotate_docs(
     input_dir: Union[str, Path],
     output_dir: Union[str, Path],
     urls_map_path: Union[str, Path, List[Dict[str, Any]]],
     hierarchy_path: Union[str, Path, Dict[str, Any]],
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    max_workers: int = 8
 ) -> Dict[str, Any]:
     """
     Annotate Markdown documentation with LLM summaries.
@@ -133,6 +240,7 @@ def annotate_docs(
         urls_map_path: Path to URLs map JSONL file or the loaded URLs map
         hierarchy_path: Path to page hierarchy JSON file or the loaded hierarchy
         api_key: Optional API key for OpenRouter
+        max_workers: Number of documents annotated concurrently
         
     Returns:
         Dictionary with URLs map, hierarchy, and count of processed files
@@ -164,97 +272,19 @@ def annotate_docs(
         print("Proceeding without LLM annotations")
         llm_client = None
     
-    # Process each file in the URLs map
-    processed_count = 0
+    # Process each file in the URLs map. The LLM calls are network-bound, so
+    # several documents are annotated at once; map() keeps the original order.
     new_urls_map = []
     
-    for entry in tqdm(urls_map, desc="Annotating documentation"):
-        try:
-            # Get Markdown file path from entry
-            md_file = entry.get('file', '')
-            if not md_file:
-                print(f"Warning: Missing file path in entry: {entry}")
-                continue
-            
-            # Make sure it has the right extension
-            if not md_file.endswith('.md'):
-                md_file = md_file.replace('.html', '.md')
-                if not md_file.endswith('.md'):
-                    md_file = f"{md_file}.md"
-            
-            # Handle case where file path already includes a directory prefix
-            # that might conflict with input_dir
-            if md_file.startswith('raw_html/') and 'raw_html' in str(md_file):
-                # Try with the raw_html/ prefix removed
-                clean_md_file = md_file.replace('raw_html/', '', 1)
-                # Also replace .html with .md if needed
-                clean_md_file = clean_md_file.replace('.html', '.md')
-                # Try just the filename part
-                base_md_file = Path(clean_md_file).name
-            else:
-                clean_md_file = md_file
-                base_md_file = Path(md_file).name
-            
-            # Try different path combinations
-            possible_paths = [
-                input_dir / md_file,                # Original path
-                input_dir / clean_md_file,         # Path with prefix removed
-                input_dir / base_md_file,          # Just the filename
-                Path(str(input_dir).rstrip('/markdown')) / md_file  # Alternative base path
-            ]
-            
-            # Find the first path that exists
-            md_path = None
-            for path in possible_paths:
-                if path.exists():
-                    md_path = path
-                    break
-            
-            # Check if any file exists
-            if not md_path:
-                print(f"Error processing {md_file}: File not found at any of {possible_paths}")
-                continue
-            
-            # Read Markdown content
-            with open(md_path, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
-            
-            # Get LLM summary if client is available
-            summary = None
-            if llm_client:
-                try:
-                    response = llm_client.summarize_markdown(markdown_content[:4000])  # Limit context size
-                    summary = response.choices[0].message.content
-                    if summary.strip().upper() == "FAIL":
-                        summary = None
-                except Exception as e:
-                    print(f"Error getting summary for {md_file}: {str(e)}")
-            
-            # Create new content with summary if available
-            if summary:
-                annotated_content = f"## Summary\n\n{summary}\n\n---\n\n{markdown_content}"
-            else:
-                annotated_content = markdown_content
-            
-            # Create output path - maintain directory structure
-            output_path = output_dir / md_file
-            
-            # Create parent directories if needed
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write annotated content
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(annotated_content)
-            
-            # Update URLs map entry
-            new_entry = entry.copy()
-            if summary:
-                new_entry['summary'] = summary
-            new_urls_map.append(new_entry)
-            processed_count += 1
-            
-        except Exception as e:
-            print(f"Error processing {entry.get('file', 'unknown file')}: {str(e)}")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda entry: _annotate_entry(entry, input_dir, output_dir, llm_client),
+            urls_map
+        )
+        for new_entry in tqdm(results, total=len(urls_map), desc="Annotating documentation"):
+            if new_entry is not None:
+                new_urls_map.append(new_entry)
+    processed_count = len(new_urls_map)
     
     # Write new URLs map
     urls_map_output = output_dir / "urls_map.jsonl"
@@ -2,13 +2,21 @@
 Generate a unified YAML manifest for documentation pages.
 """
 from __future__ import annotations
-from datetime import datetime
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Any, Union, Optional
+from urllib.parse import urlparse
 import yaml
-import json
 import os
 
+try:
+    # libyaml's C emitter streams straight to the file and is much faster
+    from yaml import CDumper as YamlDumper
+except ImportError:
+    from yaml import Dumper as YamlDumper
+
+from thinkmark.utils.json_io import load_json, load_jsonl
+
 
 def generate_manifest(
     output_dir: Union[str, Path], 
@@ -37,42 +45,34 @@ def generate_manifest(
     # Load URLs map
     urls_map = []
     if isinstance(urls_map_path, (str, Path)):
-        import jsonlines
-        with jsonlines.open(urls_map_path) as reader:
-            for item in reader:
-                urls_map.append(item)
+        urls_map = load_jsonl(urls_map_path)
     else:
         urls_map = urls_map_path
     
     # Load hierarchy
     hierarchy = {}
     if isinstance(hierarchy_path, (str, Path)):
-        with open(hierarchy_path, 'r', encoding='utf-8') as f:
-            hierarchy = json.load(f)
+        hierarchy = load_json(hierarchy_path)
     else:
         hierarchy = hierarchy_path
     
     # Load page info
     page_info = {}
     if isinstance(page_info_path, (str, Path)):
-        with open(page_info_path, 'r', encoding='utf-8') as f:
-            page_info = json.load(f)
+        page_info = load_json(page_info_path)
     else:
         page_info = page_info_path
     
     # Load parent map
     parent_map = {}
     if isinstance(parent_map_path, (str, Path)):
-        with open(parent_map_path, 'r', encoding='utf-8') as f:
-            parent_map = json.load(f)
+        parent_map = load_json(parent_map_path)
     else:
         parent_map = parent_map_path
     
     # Build children map from parent map
-    children_map = {}
+    children_map = defaultdict(list)
     for child_url, parent_url in parent_map.items():
-        if parent_url not in children_map:
-            children_map[parent_url] = []
         children_map[parent_url].append(child_url)
     
     # Find root URLs (pages without parents)
@@ -86,7 +86,6 @@ def generate_manifest(
     # Create base_url from common prefix if possible
     base_url = ""
     if urls_map:
-        from urllib.parse import urlparse
         parsed_urls = [urlparse(entry['url']) for entry in urls_map]
         domains = {f"{p.scheme}://{p.netloc}" for p in parsed_urls}
         if len(domains) == 1:
@@ -125,9 +124,11 @@ def generate_manifest(
                 try:
                     with open(annotated_path, 'r', encoding='utf-8') as f:
                         content = f.read()
-                        # Extract summary if it exists (between "## Summary" and "---")
-                        if "## Summary" in content and "---" in content:
-                            summary = content.split("## Summary")[1].split("---")[0].strip()
+                        # Extract summary if it exists (between "## Summary" and "---");
+                        # partition stops at the first match instead of splitting the whole page
+                        _, found, rest = content.partition("## Summary")
+                        if found and "---" in content:
+                            summary = rest.partition("## Summary")[0].partition("---")[0].strip()
                             manifest["pages"][url]["summary"] = summary
                 except Exception as e:
                     print(f"Error extracting summary for {url}: {str(e)}")
@@ -143,6 +144,6 @@ def generate_manifest(
     
     # Write the manifest to YAML
     with open(output_file, 'w', encoding='utf-8') as f:
-        yaml.dump(manifest, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(manifest, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
     
     return output_file
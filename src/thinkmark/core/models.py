@@ -5,13 +5,14 @@ These models represent the unified data structures used across the pipeline step
 to reduce intermediate file operations and improve memory efficiency.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-import json
-import jsonlines
 from uuid import uuid4
 
+from thinkmark.utils.json_io import load_json, load_jsonl, save_json, save_jsonl
+
 @dataclass
 class Document:
     """
@@ -110,6 +111,8 @@ class PipelineState:
             node = self._build_hierarchy_node(doc, visited_ids)
             if node:
                 hierarchy["children"].append(node)
+            # Roots stay visited, so a later root cannot nest an earlier one
+            visited_ids.add(doc.id)
         
         self.hierarchy = hierarchy
         return hierarchy
@@ -123,17 +126,21 @@ class PipelineState:
         if doc.id in visited_ids:
             return None
         
-        # Mark this document as visited
+        # Mark this document as visited while its subtree is built. The set
+        # holds the current path only, so it is shared instead of copied per
+        # child and the document is removed again on the way back up.
         visited_ids.add(doc.id)
         
         children = []
         for child_id in doc.children_ids:
             child = self.documents.get(child_id)
             if child:
-                child_node = self._build_hierarchy_node(child, visited_ids.copy())
+                child_node = self._build_hierarchy_node(child, visited_ids)
                 if child_node:
                     children.append(child_node)
         
+        visited_ids.discard(doc.id)
+        
         return {
             "id": doc.id,
             "title": doc.title,
@@ -149,29 +156,31 @@ class PipelineState:
         self.content_dir.mkdir(parents=True, exist_ok=True)
         
         # Save hierarchy
-        hierarchy_path = self.output_dir / "hierarchy.json"
-        with open(hierarchy_path, "w", encoding="utf-8") as f:
-            json.dump(self.hierarchy, f, indent=2)
+        save_json(self.hierarchy, self.output_dir / "hierarchy.json")
         
         # Save URL map
         urls_map_path = self.output_dir / "urls_map.jsonl"
         url_entries = [{"url": url, "id": doc_id} for url, doc_id in self.url_map.items()]
-        with jsonlines.open(urls_map_path, mode="w") as writer:
-            writer.write_all(url_entries)
-        
-        # Save documents to individual files
-        for doc_id, doc in self.documents.items():
-            doc_path = self.content_dir / doc.filename
-            with open(doc_path, "w", encoding="utf-8") as f:
-                f.write(doc.content)
-            
-            # Save document attributes (excluding content) and metadata
-            doc_as_dict = doc.to_dict()
-            del doc_as_dict['content']  # Content is saved in the .md file
+        save_jsonl(url_entries, urls_map_path)
+        
+        # Save documents to individual files. The writes are independent and
+        # I/O bound, so spread them over a thread pool.
+        with ThreadPoolExecutor() as executor:
+            # Consume the results so any write error is raised here
+            list(executor.map(self._save_document, self.documents.values()))
+    
+    def _save_document(self, doc: Document) -> None:
+        """Write a document's content and metadata files to the content directory."""
+        doc_path = self.content_dir / doc.filename
+        with open(doc_path, "w", encoding="utf-8") as f:
+            f.write(doc.content)
+        
+        # Save document attributes (excluding content) and metadata
+        doc_as_dict = doc.to_dict()
+        del doc_as_dict['content']  # Content is saved in the .md file
 
-            meta_path = self.content_dir / f"{doc.id}.meta.json"
-            with open(meta_path, "w", encoding="utf-8") as f:
-                json.dump(doc_as_dict, f, indent=2)
+        # save_json encodes the whole document and writes it once
+        save_json(doc_as_dict, self.content_dir / f"{doc.id}.meta.json")
     
     @classmethod
     def load(cls, site_url: str, output_dir: Path) -> 'PipelineState':
@@ -191,45 +200,59 @@ class PipelineState:
         # Load URL map
         urls_map_path = output_dir / "urls_map.jsonl"
         if urls_map_path.exists():
-            with jsonlines.open(urls_map_path, mode="r") as reader:
-                for item in reader:
-                    state.url_map[item["url"]] = item["id"]
+            for item in load_jsonl(urls_map_path):
+                state.url_map[item["url"]] = item["id"]
         
         # Load hierarchy
         hierarchy_path = output_dir / "hierarchy.json"
         if hierarchy_path.exists():
-            with open(hierarchy_path, "r", encoding="utf-8") as f:
-                state.hierarchy = json.load(f)
+            state.hierarchy = load_json(hierarchy_path)
         
-        # Load documents
+        # Load documents. Each one is two small independent reads, so fetch
+        # them from a thread pool and add them back in directory order.
         content_dir = output_dir / "content"
         if content_dir.exists():
-            for meta_file in content_dir.glob("*.meta.json"):
-                doc_id = meta_file.stem.replace(".meta", "")
-                content_file = content_dir / f"{doc_id}.md"
-                
-                if content_file.exists():
-                    # Load the dictionary saved by to_dict (which excludes content)
-                    with open(meta_file, "r", encoding="utf-8") as f:
-                        doc_data_from_meta = json.load(f)
-                
-                    # Load content separately
-                    with open(content_file, "r", encoding="utf-8") as f:
-                        content = f.read()
-                
-                    # Add content back to the dictionary for Document.from_dict
-                    doc_data_from_meta['content'] = content
-                    
-                    # Use Document.from_dict to reconstruct the Document object
-                    # Ensure the doc_id from the filename matches the one in the data, or prioritize one.
-                    # Document.from_dict will use 'id' from doc_data_from_meta if present.
-                    if 'id' not in doc_data_from_meta or doc_data_from_meta['id'] != doc_id:
-                        # This case should ideally not happen if filenames are derived from doc.id
-                        # If it does, we might prefer the ID from the filename or log a warning.
-                        # For now, ensure the loaded data uses the ID from the filename if different.
-                        doc_data_from_meta['id'] = doc_id
-
-                    doc = Document.from_dict(doc_data_from_meta)
-                    state.documents[doc_id] = doc
+            with ThreadPoolExecutor() as executor:
+                for doc in executor.map(cls._load_document, content_dir.glob("*.meta.json")):
+                    if doc is not None:
+                        state.documents[doc.id] = doc
         
         return state
+
+    @staticmethod
+    def _load_document(meta_file: Path) -> Optional[Document]:
+        """
+        Load a single document from its .meta.json file and matching .md file.
+        
+        Args:
+            meta_file: Path to the document's metadata file
+            
+        Returns:
+            The loaded Document, or None if its content file is missing
+        """
+        doc_id = meta_file.stem.replace(".meta", "")
+        content_file = meta_file.parent / f"{doc_id}.md"
+        
+        if not content_file.exists():
+            return None
+        
+        # Load the dictionary saved by to_dict (which excludes content)
+        doc_data_from_meta = load_json(meta_file)
+    
+        # Load content separately
+        with open(content_file, "r", encoding="utf-8") as f:
+            content = f.read()
+    
+        # Add content back to the dictionary for Document.from_dict
+        doc_data_from_meta['content'] = content
+        
+        # Use Document.from_dict to reconstruct the Document object
+        # Ensure the doc_id from the filename matches the one in the data, or prioritize one.
+        # Document.from_dict will use 'id' from doc_data_from_meta if present.
+        if 'id' not in doc_data_from_meta or doc_data_from_meta['id'] != doc_id:
+            # This case should ideally not happen if filenames are derived from doc.id
+            # If it does, we might prefer the ID from the filename or log a warning.
+            # For now, ensure the loaded data uses the ID from the filename if different.
+            doc_data_from_meta['id'] = doc_id
+
+        return Document.from_dict(doc_data_from_meta)
@@ -5,6 +5,8 @@ This module provides a streamlined, memory-efficient pipeline that passes data
 between stages without unnecessary serialization/deserialization steps.
 """
 
+import hashlib
+import json
 import re
 import shutil
 from pathlib import Path
@@ -19,6 +21,11 @@ from thinkmark.utils.logging import configure_logging, log_exception
 logger = configure_logging(module_name="thinkmark.core.pipeline")
 console = Console()
 
+# File in the vector index directory recording which inputs it was built from
+INDEX_FINGERPRINT_FILE = "input_fingerprint.txt"
+# Hierarchy files beside the annotated directory that the chunker reads
+HIERARCHY_FILES = ("page_hierarchy.json", "hierarchy.json")
+
 # Function to convert custom [code] tags to standard markdown code fences
 def preprocess_markdown_content(content):
     """Convert custom [code] tags to standard markdown code fences."""
@@ -127,9 +134,17 @@ def markify_stage(state: PipelineState) -> None:
     # Process documents individually for better error handling
     from thinkmark.markify.adapter import process_document
     
-    # Create annotated directory for saving markdown files
+    # Create annotated directory for saving markdown files, along with any
+    # subdirectories the documents need, once up front
     annotated_dir = state.output_dir / "annotated"
-    annotated_dir.mkdir(parents=True, exist_ok=True)
+    output_dirs = {
+        (annotated_dir / doc.filename).parent
+        for doc in state.documents.values()
+        if doc.metadata.get("type") == "html"
+    }
+    output_dirs.add(annotated_dir)
+    for output_dir in sorted(output_dirs):
+        output_dir.mkdir(parents=True, exist_ok=True)
     
     # Process each document in-place
     for doc_id, doc in state.documents.items():
@@ -151,14 +166,14 @@ def markify_stage(state: PipelineState) -> None:
                 # Save to annotated directory (using the updated 'doc' object)
                 if doc.content:
                     doc_path = annotated_dir / doc.filename # doc.filename uses doc.id, which is unchanged
-                    doc_path.parent.mkdir(parents=True, exist_ok=True)
                     
                     # Add metadata header for better search results
                     metadata_header = f"---\ntitle: {doc.title}\nurl: {doc.url}\nsite_name: {state.site_url}\n---\n\n"
                     
-                    # Write the markdown content to the file
+                    # Write header and content as separate buffers rather than
+                    # concatenating them into a second copy of the document
                     with open(doc_path, "w", encoding="utf-8") as f:
-                        f.write(metadata_header + doc.content)
+                        f.writelines((metadata_header, doc.content))
                         
                     logger.debug(f"Saved markdown to {doc_path}")
             except Exception as e:
@@ -174,6 +189,38 @@ def markify_stage(state: PipelineState) -> None:
     
 
 
+def _fingerprint_index_inputs(annotated_dir: Path, build_settings: Dict[str, Any]) -> str:
+    """
+    Hash everything a vector index built from a directory depends on.
+    
+    That is the names and contents of every file under the directory, the
+    hierarchy files next to it that the chunker reads for breadcrumb and
+    section metadata, and the settings the index is built with.
+    
+    Args:
+        annotated_dir: Directory of annotated Markdown files to fingerprint
+        build_settings: Settings the index is built with
+        
+    Returns:
+        Hex digest that changes whenever any input or setting changes
+    """
+    digest = hashlib.sha256()
+    for path in sorted(p for p in annotated_dir.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(annotated_dir).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    
+    for name in HIERARCHY_FILES:
+        path = annotated_dir.parent / name
+        digest.update(f"../{name}".encode("utf-8"))
+        digest.update(b"\0")
+        if path.is_file():
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    
+    digest.update(json.dumps(build_settings, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
 def build_vector_index(state: PipelineState) -> Path:
     """
     Build a vector index from the documents.
@@ -186,7 +233,7 @@ def build_vector_index(state: PipelineState) -> Path:
     """
     # Temporarily disable llama_index warnings about markdown parsing
     logging.getLogger('llama_index').setLevel(logging.ERROR)
-    from thinkmark.vector.processor import build_index
+    from thinkmark.vector.processor import build_index, index_build_settings
     
     # Create vector directory
     vector_dir = state.output_dir / "vector_index"
@@ -198,6 +245,19 @@ def build_vector_index(state: PipelineState) -> Path:
     # Build the index with proper initialization of storage context
     # This addresses the issue mentioned in memory b3a40884-739b-4cf5-b683-9cd10353f79d
     try:
+        # Skip the rebuild entirely when the annotated docs, hierarchy and
+        # build settings are unchanged since the index on disk was built;
+        # embedding is by far the slowest step
+        fingerprint_path = vector_dir / INDEX_FINGERPRINT_FILE
+        input_fingerprint = _fingerprint_index_inputs(annotated_dir, index_build_settings())
+        if (
+            (vector_dir / "docstore.json").exists()
+            and fingerprint_path.exists()
+            and fingerprint_path.read_text(encoding="utf-8") == input_fingerprint
+        ):
+            logger.info(f"Index inputs unchanged, reusing vector index at: {vector_dir}")
+            return vector_dir
+        
         # Clean up any existing vector index files to prevent issues
         if vector_dir.exists():
             logger.info(f"Removing existing vector index directory: {vector_dir}")
@@ -206,11 +266,13 @@ def build_vector_index(state: PipelineState) -> Path:
             
         # Build the index with the correctly structured directory
         # The vector processor will initialize storage context internally
-        build_index(
+        index = build_index(
             input_dir=annotated_dir,
             persist_dir=vector_dir,
             rebuild=True  # Always rebuild to ensure fresh index
         )
+        if index is not None:
+            fingerprint_path.write_text(input_fingerprint, encoding="utf-8")
         
         logger.info(f"Vector index built successfully at: {vector_dir}")
         return vector_dir
@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional, List
 
 from thinkmark.markify.markdown_converter import MarkdownConverter
 from thinkmark.core.models import Document, PipelineState
+from thinkmark.utils.text import escape_rich_tags
 
 
 def process_document(doc: Document) -> Document:
@@ -32,12 +33,7 @@ def process_document(doc: Document) -> Document:
     markdown_content = converter.convert(html_content)
     
     # Escape Rich formatting tags in the content to prevent markup errors
-    # Common Rich formatting tags that might appear in markdown code blocks
-    rich_tags = ['[bold]', '[/bold]', '[italic]', '[/italic]', '[code]', '[/code]', 
-                '[red]', '[/red]', '[green]', '[/green]', '[blue]', '[/blue]']
-    
-    for tag in rich_tags:
-        markdown_content = markdown_content.replace(tag, '\\' + tag)
+    markdown_content = escape_rich_tags(markdown_content)
     
     # Create a new document with Markdown content
     md_doc = Document(
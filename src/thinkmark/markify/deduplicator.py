@@ -2,10 +2,12 @@
 
 from typing import List, Dict, Any, Tuple
 from pathlib import Path
-import hashlib
 import re
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+
+# A heading and everything up to the next heading or the end of the file
+SECTION_PATTERN = re.compile(r'^(#+\s+.*?)(?=^#+\s+|\Z)', re.MULTILINE | re.DOTALL)
 
 class Deduplicator:
     """De-duplicates content across pages and within sections."""
@@ -17,9 +19,10 @@ class Deduplicator:
                    processed_files: List[Tuple[Dict[str, Any], Dict[str, Any]]],
                    output_dir: Path = None) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
         """Deduplicate content across processed files."""
-        # Find exact duplicates using content hashes
-        content_hashes = {}
-        file_contents = {}
+        # Find exact duplicates by grouping on the text itself. The kept text
+        # is needed for near-duplicate detection anyway, and a dict key is
+        # hashed once by Python and compared exactly, so no digest is needed.
+        content_groups = {}
         
         for orig_entry, new_entry in processed_files:
             try:
@@ -36,40 +39,22 @@ class Deduplicator:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
-                content_hash = hashlib.md5(content.encode()).hexdigest()
-                file_contents[file_path] = content
-                
-                if content_hash in content_hashes:
-                    content_hashes[content_hash].append((orig_entry, new_entry))
+                group = content_groups.get(content)
+                if group is not None:
+                    # Exact duplicate: its text is never needed again, so let it go
+                    group.append((orig_entry, new_entry))
                 else:
-                    content_hashes[content_hash] = [(orig_entry, new_entry)]
+                    content_groups[content] = [(orig_entry, new_entry)]
             except Exception as e:
                 print(f"Error processing {new_entry['file']}: {e}")
         
-        # Keep only one file from each exact duplicate group
-        deduplicated = []
-        seen_hashes = set()
-        
-        for content_hash, entries in content_hashes.items():
-            if content_hash not in seen_hashes:
-                deduplicated.append(entries[0])
-                seen_hashes.add(content_hash)
+        # Keep only one file from each exact duplicate group; its text is the
+        # group's key, so both lists line up by index
+        deduplicated = [entries[0] for entries in content_groups.values()]
+        contents = list(content_groups)
         
         # Find near-duplicates using TF-IDF and cosine similarity
         if len(deduplicated) > 1:
-            # Get paths that exist in file_contents
-            paths = []
-            contents = []
-            for entry in deduplicated:
-                if output_dir:
-                    path = output_dir / entry[1]['file']
-                else:
-                    path = Path(entry[1]['file'])
-                    
-                if path in file_contents:
-                    paths.append(path)
-                    contents.append(file_contents[path])
-            
             # Create TF-IDF vectors
             vectorizer = TfidfVectorizer(
                 strip_accents='unicode',
@@ -81,18 +66,17 @@ class Deduplicator:
             
             try:
                 tfidf_matrix = vectorizer.fit_transform(contents)
-                cosine_sim = cosine_similarity(tfidf_matrix, tfidf_matrix)
+                # TF-IDF rows are L2-normalized, so the sparse dot product is
+                # the cosine similarity, computed only for overlapping pairs
+                cosine_sim = (tfidf_matrix @ tfidf_matrix.T).tocoo()
                 
-                # Find near-duplicates
-                near_dupes = set()
-                for i in range(len(paths)):
-                    for j in range(i+1, len(paths)):
-                        if cosine_sim[i, j] > self.similarity_threshold:
-                            # Keep the longer document
-                            if len(contents[i]) >= len(contents[j]):
-                                near_dupes.add(j)
-                            else:
-                                near_dupes.add(i)
+                # Find near-duplicates among the pairs above the diagonal
+                similar = (cosine_sim.row < cosine_sim.col) & (cosine_sim.data > self.similarity_threshold)
+                rows = cosine_sim.row[similar]
+                cols = cosine_sim.col[similar]
+                # Keep the longer document of each pair
+                lengths = np.fromiter((len(c) for c in contents), dtype=np.int64, count=len(contents))
+                near_dupes = set(np.where(lengths[rows] >= lengths[cols], cols, rows).tolist())
                 
                 # Filter out near-duplicates
                 deduplicated = [entry for idx, entry in enumerate(deduplicated) 
@@ -106,23 +90,18 @@ class Deduplicator:
     def deduplicate_sections(self, content: str) -> str:
         """Deduplicate repeated sections within a file."""
         # Split content into sections using headings
-        section_pattern = r'^(#+\s+.*?)(?=^#+\s+|\Z)'
-        sections = re.findall(section_pattern, content, re.MULTILINE | re.DOTALL)
+        sections = SECTION_PATTERN.findall(content)
         
         if not sections:
             return content
             
         # Get unique sections
-        unique_sections = []
-        section_hashes = set()
-        
+        # Keyed by the stripped text itself, which the dict hashes once and
+        # compares exactly on collision, so no digest is needed; setdefault
+        # keeps the first occurrence and dict order keeps the document order
+        unique_sections = {}
         for section in sections:
-            # Create a hash of the content
-            section_hash = hashlib.md5(section.strip().encode()).hexdigest()
-            
-            if section_hash not in section_hashes:
-                unique_sections.append(section)
-                section_hashes.add(section_hash)
+            unique_sections.setdefault(section.strip(), section)
         
         # Reconstruct content with unique sections
-        return ''.join(unique_sections)
+        return ''.join(unique_sections.values())
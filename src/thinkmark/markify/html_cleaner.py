@@ -23,17 +23,17 @@ class HTMLCleaner:
         """Clean HTML by removing UI elements."""
         soup = BeautifulSoup(html_content, 'lxml')
         
-        # Remove elements by selectors
-        for selector in self.remove_selectors:
-            for element in soup.select(selector):
+        # Remove elements matching any of the selectors in a single tree walk.
+        # Nested matches may already be gone with their ancestor.
+        for element in soup.select(", ".join(self.remove_selectors)):
+            if not element.decomposed:
                 element.decompose()
         
-        # Extract main content if identifiable
+        # Extract main content if identifiable, stopping at the first match
         main_content = None
         for selector in self.keep_selectors:
-            elements = soup.select(selector)
-            if elements:
-                main_content = elements[0]
+            main_content = soup.select_one(selector)
+            if main_content is not None:
                 break
         
         if main_content:
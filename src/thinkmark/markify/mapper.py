@@ -2,6 +2,27 @@
 
 from typing import Dict, Any, List, Tuple
 
+
+def _update_node(node: Any, file_mapping: Dict[str, str], url_mapping: Dict[str, str]) -> Any:
+    """Recursively copy a hierarchy node, remapping its file and URL."""
+    if not isinstance(node, dict):
+        return node
+        
+    result = {}
+    for key, value in node.items():
+        if key == 'file' and value in file_mapping:
+            result[key] = file_mapping[value]
+        elif key == 'url' and value in url_mapping:
+            result[key] = url_mapping[value]
+        elif key == 'children' and isinstance(value, list):
+            # Create fresh copies of children to avoid reference cycles
+            result[key] = [_update_node(child, file_mapping, url_mapping) for child in value]
+        else:
+            result[key] = value
+    
+    return result
+
+
 class Mapper:
     """Maintains mappings and updates hierarchies."""
     
@@ -30,28 +51,9 @@ class Mapper:
             for orig, new in deduplicated_files
         }
         
-        # Function to recursively update hierarchy
-        def update_node(node):
-            if not isinstance(node, dict):
-                return node
-                
-            result = {}
-            for key, value in node.items():
-                if key == 'file' and value in file_mapping:
-                    result[key] = file_mapping[value]
-                elif key == 'url' and value in url_mapping:
-                    result[key] = url_mapping[value]
-                elif key == 'children' and isinstance(value, list):
-                    # Create fresh copies of children to avoid reference cycles
-                    result[key] = [update_node(child) for child in value]
-                else:
-                    result[key] = value
-            
-            return result
-        
         # Update the hierarchy with a fresh copy to avoid reference cycles
         if hierarchy:
-            updated_hierarchy = update_node(hierarchy)
+            updated_hierarchy = _update_node(hierarchy, file_mapping, url_mapping)
             return updated_hierarchy
         
         return hierarchy
@@ -4,6 +4,32 @@ import html2text
 import re
 from bs4 import BeautifulSoup
 
+MULTI_NEWLINE_PATTERN = re.compile(r'\n{3,}')
+CODE_BLOCK_PATTERN = re.compile(r'```.*?\n(.*?)```', re.DOTALL)
+
+
+def _fix_code_block(match: re.Match) -> str:
+    """Strip the common leading indentation from a fenced code block."""
+    code = match.group(1)
+    lines = code.split('\n')
+    if not lines:
+        return match.group(0)
+        
+    # Find minimum indentation for non-empty lines
+    non_empty_lines = [line for line in lines if line.strip()]
+    if not non_empty_lines:
+        return match.group(0)
+        
+    min_indent = min((len(line) - len(line.lstrip(' '))) 
+                    for line in non_empty_lines)
+    
+    # Remove indentation
+    cleaned_lines = [line[min_indent:] if line.strip() else line 
+                   for line in lines]
+    
+    return f"```{match.group(0).split('```')[0].strip()}\n{''.join(cleaned_lines)}```"
+
+
 class MarkdownConverter:
     """Converts HTML to Markdown format."""
     
@@ -58,31 +84,9 @@ class MarkdownConverter:
     def _clean_markdown(self, markdown: str) -> str:
         """Clean up the Markdown content."""
         # Replace multiple newlines with max two
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
+        markdown = MULTI_NEWLINE_PATTERN.sub('\n\n', markdown)
         
         # Fix code blocks
-        code_block_pattern = r'```.*?\n(.*?)```'
-        
-        def fix_code_block(match):
-            code = match.group(1)
-            lines = code.split('\n')
-            if not lines:
-                return match.group(0)
-                
-            # Find minimum indentation for non-empty lines
-            non_empty_lines = [line for line in lines if line.strip()]
-            if not non_empty_lines:
-                return match.group(0)
-                
-            min_indent = min((len(line) - len(line.lstrip(' '))) 
-                            for line in non_empty_lines)
-            
-            # Remove indentation
-            cleaned_lines = [line[min_indent:] if line.strip() else line 
-                           for line in lines]
-            
-            return f"```{match.group(0).split('```')[0].strip()}\n{''.join(cleaned_lines)}```"
-        
-        markdown = re.sub(code_block_pattern, fix_code_block, markdown, flags=re.DOTALL)
+        markdown = CODE_BLOCK_PATTERN.sub(_fix_code_block, markdown)
         
         return markdown
@@ -3,7 +3,9 @@
 import os
 import json
 import jsonlines
-from typing import Dict, List, Any, Union, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Any, Optional, Set, Union, Tuple
 from pathlib import Path
 from tqdm import tqdm
 from urllib.parse import urlparse
@@ -13,13 +15,114 @@ from thinkmark.markify.deduplicator import Deduplicator
 from thinkmark.markify.markdown_converter import MarkdownConverter
 from thinkmark.markify.mapper import Mapper
 from thinkmark.utils.json_io import load_json, load_jsonl, save_json, save_jsonl
+# The same URL-to-filename function that the scraper uses
+from thinkmark.utils.url import url_to_filename
+
+
+# Per-process converters, created once by _init_worker in each worker
+_html_cleaner: Optional[HTMLCleaner] = None
+_markdown_converter: Optional[MarkdownConverter] = None
+_deduplicator: Optional[Deduplicator] = None
+# Directories this process has created, so each one is only created once
+_created_dirs: Set[Path] = set()
+
+# Below this many entries, converting in-process beats starting a worker pool
+PARALLEL_MIN_ENTRIES = 32
+
+
+def _init_worker() -> None:
+    """Create the converters used by _convert_entry in this process."""
+    global _html_cleaner, _markdown_converter, _deduplicator
+    _html_cleaner = HTMLCleaner()
+    _markdown_converter = MarkdownConverter()
+    _deduplicator = Deduplicator()
+    _created_dirs.clear()
+
+
+def _convert_entry(
+    entry: Dict[str, Any],
+    input_dir: Path,
+    output_dir: Path
+) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Convert the HTML file of one URLs map entry to Markdown in output_dir.
+    
+    Returns:
+        Tuple of (original entry, updated entry), or None if the file was skipped
+    """
+    url = ''
+    try:
+        # Get URL from entry - this is the key field we need
+        url = entry.get('url', '')
+        if not url:
+            print(f"Warning: Missing URL in entry: {entry}")
+            return None
+        
+        # Generate the exact same filename that the scraper would have used
+        # This ensures consistency between scrape and markify stages
+        html_filename = url_to_filename(url)
+        
+        # Full path to the input HTML file
+        html_path = input_dir / html_filename
+        
+        # Check if file exists
+        if not html_path.exists():
+            # Try alternative paths if the file doesn't exist
+            alt_path_1 = Path(str(input_dir).rstrip('/raw_html')) / html_filename
+            alt_path_2 = input_dir / entry.get('file', '')
+            
+            if alt_path_1.exists():
+                html_path = alt_path_1
+            elif alt_path_2.exists() and entry.get('file'):
+                html_path = alt_path_2
+            else:
+                print(f"Error processing {url}: File not found at {html_path}")
+                return None
+        
+        # Read HTML content
+        with open(html_path, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+        
+        # Extract base URL for fixing relative links
+        base_url = _get_base_url(url)
+        
+        # Clean HTML (remove UI elements)
+        clean_html = _html_cleaner.clean(html_content, base_url=base_url)
+        
+        # Convert to Markdown
+        markdown_content = _markdown_converter.convert(clean_html)
+        
+        # Deduplicate sections within the content
+        markdown_content = _deduplicator.deduplicate_sections(markdown_content)
+        
+        # Create output path - maintain directory structure but use .md extension
+        md_file = Path(html_filename).with_suffix('.md')
+        output_path = output_dir / md_file
+        
+        # Create parent directories if needed
+        if output_path.parent not in _created_dirs:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(output_path.parent)
+        
+        # Write Markdown content as one encoded buffer
+        output_path.write_bytes(markdown_content.encode('utf-8'))
+        
+        # Update URLs map entry
+        new_entry = entry.copy()
+        new_entry['file'] = str(md_file)
+        return entry, new_entry
+        
+    except Exception as e:
+        print(f"Error processing {url}: {str(e)}")
+        return None
 
 
 def process_docs(
     input_dir: Union[str, Path],
     output_dir: Union[str, Path],
     urls_map_path: Union[str, Path, List[Dict[str, Any]]],
-    hierarchy_path: Union[str, Path, Dict[str, Any]]
+    hierarchy_path: Union[str, Path, Dict[str, Any]],
+    max_workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Process HTML documentation to Markdown.
@@ -29,6 +132,9 @@ def process_docs(
         output_dir: Directory to output Markdown files
         urls_map_path: Path to URLs map JSONL file or the loaded URLs map
         hierarchy_path: Path to page hierarchy JSON file or the loaded hierarchy
+        max_workers: Number of worker processes for conversion (defaults to the
+            CPU count, capped at the number of entries); 1, or fewer than
+            PARALLEL_MIN_ENTRIES entries, converts in the current process
         
     Returns:
         Dictionary with URLs map and hierarchy
@@ -41,9 +147,7 @@ def process_docs(
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Initialize components
-    html_cleaner = HTMLCleaner()
     deduplicator = Deduplicator()
-    markdown_converter = MarkdownConverter()
     mapper = Mapper()
     
     # Load URLs map
@@ -58,77 +162,25 @@ def process_docs(
     else:
         hierarchy = hierarchy_path
     
-    # Import the same URL-to-filename function that the scraper uses
-    from thinkmark.utils.url import url_to_filename
-    
-    # Process each file in the URLs map
-    processed_files = []
-    new_urls_map = []
-    
-    for entry in tqdm(urls_map, desc="Converting HTML to Markdown"):
-        try:
-            # Get URL from entry - this is the key field we need
-            url = entry.get('url', '')
-            if not url:
-                print(f"Warning: Missing URL in entry: {entry}")
-                continue
-            
-            # Generate the exact same filename that the scraper would have used
-            # This ensures consistency between scrape and markify stages
-            html_filename = url_to_filename(url)
-            
-            # Full path to the input HTML file
-            html_path = input_dir / html_filename
-            
-            # Check if file exists
-            if not html_path.exists():
-                # Try alternative paths if the file doesn't exist
-                alt_path_1 = Path(str(input_dir).rstrip('/raw_html')) / html_filename
-                alt_path_2 = input_dir / entry.get('file', '')
-                
-                if alt_path_1.exists():
-                    html_path = alt_path_1
-                elif alt_path_2.exists() and entry.get('file'):
-                    html_path = alt_path_2
-                else:
-                    print(f"Error processing {url}: File not found at {html_path}")
-                    continue
-            
-            # Read HTML content
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Extract base URL for fixing relative links
-            base_url = _get_base_url(entry['url']) if 'url' in entry else None
-            
-            # Clean HTML (remove UI elements)
-            clean_html = html_cleaner.clean(html_content, base_url=base_url)
-            
-            # Convert to Markdown
-            markdown_content = markdown_converter.convert(clean_html)
-            
-            # Deduplicate sections within the content
-            markdown_content = deduplicator.deduplicate_sections(markdown_content)
-            
-            # Create output path - maintain directory structure but use .md extension
-            md_file = Path(html_filename).with_suffix('.md')
-            output_path = output_dir / md_file
-            
-            # Create parent directories if needed
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write Markdown content
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            # Update URLs map entry
-            new_entry = entry.copy()
-            new_entry['file'] = str(md_file)
-            new_urls_map.append(new_entry)
-            processed_files.append((entry, new_entry))
-            
-        except Exception as e:
-            print(f"Error processing {url}: {str(e)}")
+    # Convert each file in the URLs map. Cleaning and conversion are CPU-bound
+    # pure Python, so files are spread over worker processes; map() keeps order.
+    convert = partial(_convert_entry, input_dir=input_dir, output_dir=output_dir)
+    if max_workers == 1 or len(urls_map) < PARALLEL_MIN_ENTRIES:
+        _init_worker()
+        executor = None
+        results = map(convert, urls_map)
+    else:
+        workers = min(max_workers or os.cpu_count() or 1, len(urls_map))
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        results = executor.map(convert, urls_map, chunksize=16)
+    try:
+        processed_files = [
+            result for result in tqdm(results, total=len(urls_map), desc="Converting HTML to Markdown")
+            if result is not None
+        ]
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
     # De-duplicate content across files
     deduplicated_files = []
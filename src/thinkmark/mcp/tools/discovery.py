@@ -6,6 +6,7 @@ It allows listing available documentation sets and their vector indexes.
 Uses the decorator pattern for registering MCP tools.
 """
 
+import logging
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -45,20 +46,23 @@ def list_available_docs(base_path: Optional[str] = None) -> Dict[str, Any]:
         #       docstore.json, index_store.json, etc.
         
         # Log all website directories we find
-        site_dirs = list(search_path.glob("*"))
-        logger.debug(f"Found {len(site_dirs)} potential website directories: {[d.name for d in site_dirs if d.is_dir()]}")
+        # scandir reports each entry's type with the listing, so picking out
+        # the directories needs no extra stat per entry
+        with os.scandir(search_path) as entries:
+            site_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Found {len(site_dirs)} potential website directories: {[d.name for d in site_dirs]}")
         
         for site_dir in site_dirs:
-            if not site_dir.is_dir():
-                continue
-                
             # Check for the vector_index subdirectory structure first
             vector_index_dir = get_vector_index_path(site_dir.name, search_path)
-            if vector_index_dir.exists() and vector_index_dir.is_dir():
-                # Check for required vector index files
+            if vector_index_dir.is_dir():
+                # Check for required vector index files, globbing the vector
+                # stores once for both the check and the file listing
                 has_docstore = (vector_index_dir / "docstore.json").exists()
                 has_index_store = (vector_index_dir / "index_store.json").exists()
-                has_vector_store_files = any(p.name.endswith("_vector_store.json") for p in vector_index_dir.glob("*_vector_store.json"))
+                vector_store_files = [p.name for p in vector_index_dir.glob("*_vector_store.json")]
+                has_vector_store_files = bool(vector_store_files)
                 
                 if has_docstore and has_index_store:
                     logger.info(f"Found vector index in {vector_index_dir} for site {site_dir.name}")
@@ -67,8 +71,7 @@ def list_available_docs(base_path: Optional[str] = None) -> Dict[str, Any]:
                         "path": str(vector_index_dir),
                         "relative_path": str(vector_index_dir.relative_to(search_path)),
                         "site_dir": str(site_dir),
-                        "files": ["docstore.json", "index_store.json"] + 
-                                [p.name for p in vector_index_dir.glob("*_vector_store.json")]
+                        "files": ["docstore.json", "index_store.json"] + vector_store_files
                     })
                     continue
                 else:
@@ -7,7 +7,7 @@ Uses the decorator pattern for registering MCP tools.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from thinkmark.utils.logging import configure_logging, log_exception
 from thinkmark.utils.paths import get_storage_path
@@ -16,6 +16,85 @@ from thinkmark.mcp.server import mcp
 # Set up logging
 logger = configure_logging(module_name="thinkmark.mcp.tools.vector")
 
+# Loaded indexes keyed by persist dir: the docstore.json mtime they were loaded
+# at, the index, and the responses already computed against that index.
+# Ordered from least to most recently used.
+_index_cache: Dict[Path, Tuple[float, Any, Dict[Tuple, Any]]] = {}
+
+# Maximum number of loaded indexes kept in memory
+INDEX_CACHE_SIZE = 4
+
+# Maximum number of responses remembered per index
+ANSWER_CACHE_SIZE = 128
+
+
+def _load_index_cached(persist_path: Path) -> Tuple[Any, Optional[Dict[Tuple, Any]]]:
+    """
+    Load the index at persist_path, reusing it until docstore.json changes.
+    
+    Returns:
+        Tuple of (index, response cache). The response cache is None when the
+        index could not be cached, and is discarded whenever the index reloads.
+    """
+    from thinkmark.vector.processor import load_index
+    
+    try:
+        mtime = (persist_path / "docstore.json").stat().st_mtime
+    except OSError:
+        # Let load_index report the missing files
+        return load_index(persist_path), None
+    
+    # Pop so that a reused index moves to the most recently used end
+    cached = _index_cache.pop(persist_path, None)
+    if cached is not None and cached[0] == mtime:
+        logger.debug(f"Reusing loaded index for {persist_path}")
+        _index_cache[persist_path] = cached
+        return cached[1], cached[2]
+    
+    index = load_index(persist_path)
+    if index is None:
+        return None, None
+    if len(_index_cache) >= INDEX_CACHE_SIZE:
+        # Evict the least recently used index
+        _index_cache.pop(next(iter(_index_cache)), None)
+    answers: Dict[Tuple, Any] = {}
+    _index_cache[persist_path] = (mtime, index, answers)
+    return index, answers
+
+
+def _run_query(index: Any, question: str, top_k: int, use_hybrid_search: bool):
+    """Build a retriever over index and run question through a query engine."""
+    from thinkmark.vector.hybrid_search import setup_hybrid_retrieval
+    from llama_index.core.query_engine import RetrieverQueryEngine
+    
+    # Create a retriever (hybrid or standard)
+    if use_hybrid_search:
+        # Only BM25 needs every node; vector retrieval reads them on demand
+        node_ids = list(index.docstore.docs.keys())
+        nodes = index.docstore.get_nodes(node_ids)
+        logger.info(f"Found {len(nodes)} nodes in the index")
+        
+        logger.info("Using hybrid search (vector + BM25)")
+        retriever = setup_hybrid_retrieval(
+            vector_index=index,
+            nodes=list(nodes),  # nodes is already a list, no need for .values()
+            similarity_top_k=top_k
+        )
+    else:
+        logger.info("Using standard vector retrieval")
+        retriever = index.as_retriever(
+            similarity_top_k=top_k
+        )
+    
+    # Create a query engine with our parameters and retriever
+    # Use RetrieverQueryEngine directly to avoid the multiple retriever issue
+    query_engine = RetrieverQueryEngine(
+        retriever=retriever
+    )
+    
+    # Execute the query
+    return query_engine.query(question)
+
 
 @mcp.tool()
 def query_docs(
@@ -42,45 +121,31 @@ def query_docs(
     """
     try:
         # Import here to avoid slow startup
-        from thinkmark.vector.processor import load_index
-        from thinkmark.vector.hybrid_search import setup_hybrid_retrieval, filter_results_by_metadata
+        from thinkmark.vector.hybrid_search import filter_results_by_metadata
         
         # Ensure path is a Path object using our centralized path management
         persist_path = get_storage_path(persist_dir)
         
+        # Surrounding whitespace does not change the question
+        question = question.strip()
+        
         logger.info(f"Querying index at {persist_path} with question: '{question}'")
         
-        # Load the vector index
-        index = load_index(persist_path)
+        # Load the vector index (cached across queries)
+        index, answers = _load_index_cached(persist_path)
         
-        # Get all node IDs and fetch all nodes
-        node_ids = list(index.docstore.docs.keys())
-        nodes = index.docstore.get_nodes(node_ids)
-        logger.info(f"Found {len(nodes)} nodes in the index")
-        
-        # Create a retriever (hybrid or standard)
-        if use_hybrid_search:
-            logger.info("Using hybrid search (vector + BM25)")
-            retriever = setup_hybrid_retrieval(
-                vector_index=index,
-                nodes=list(nodes),  # nodes is already a list, no need for .values()
-                similarity_top_k=top_k
-            )
+        # Identical questions against an unchanged index get the same response
+        cache_key = (question, top_k, use_hybrid_search)
+        response = answers.get(cache_key) if answers is not None else None
+        if response is not None:
+            logger.info("Reusing cached response for this question")
         else:
-            logger.info("Using standard vector retrieval")
-            retriever = index.as_retriever(
-                similarity_top_k=top_k
-            )
-        
-        # Create a query engine with our parameters and retriever
-        # Use RetrieverQueryEngine directly to avoid the multiple retriever issue
-        from llama_index.core.query_engine import RetrieverQueryEngine
-        query_engine = RetrieverQueryEngine(
-            retriever=retriever
-        )
-        
-        # Execute the query
-        response = query_engine.query(question)
+            response = _run_query(index, question, top_k, use_hybrid_search)
+            if answers is not None:
+                if len(answers) >= ANSWER_CACHE_SIZE:
+                    # Evict the oldest entry
+                    answers.pop(next(iter(answers)), None)
+                answers[cache_key] = response
         
         # Extract source nodes for context
         source_nodes = response.source_nodes
@@ -94,13 +159,18 @@ def query_docs(
                 min_score=similarity_threshold
             )
         
-        # Process the source nodes
+        # Process the source nodes, skipping chunks whose text was already
+        # returned (hybrid retrieval can surface the same text more than once)
+        unique_nodes = {}
+        for node in source_nodes:
+            unique_nodes.setdefault(node.text, node)
+        
         sources = []
-        for i, node in enumerate(source_nodes):
+        for chunk_id, node in enumerate(unique_nodes.values(), 1):
             node_info = {
-                "chunk_id": i + 1,
+                "chunk_id": chunk_id,
                 "text": node.text,
-                "score": node.score if hasattr(node, "score") else None,
+                "score": getattr(node, "score", None),
                 "metadata": node.metadata,
                 "file_path": node.metadata.get("file_path", "Unknown"),
                 "content_type": node.metadata.get("content_type", "unknown"),
@@ -5,6 +5,8 @@ This module provides functions that adapt the existing scraping functionality
 to work with the new pipeline architecture.
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import logging
@@ -35,7 +37,7 @@ def extract_parent_relationships(hierarchy: Dict[str, Any]) -> Dict[str, str]:
             return
         
         url = node.get("url")
-        children = node.get("children", [])
+        children = node.get("children", ())
         
         if url and parent_url:
             parent_map[url] = parent_url
@@ -48,6 +50,18 @@ def extract_parent_relationships(hierarchy: Dict[str, Any]) -> Dict[str, str]:
     return parent_map
 
 
+def _read_html(file_path: Path) -> str:
+    """Read a saved HTML page, returning an empty string if it is missing or unreadable."""
+    if not file_path.exists():
+        return ""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return f.read()
+    except Exception as e:
+        logger.error(f"Error reading HTML file {file_path}: {str(e)}")
+        return ""
+
+
 def create_documents_from_crawl(crawl_result: Dict[str, Any], html_dir: Path) -> List[Document]:
     """
     Create Document objects from crawler results.
@@ -66,28 +80,27 @@ def create_documents_from_crawl(crawl_result: Dict[str, Any], html_dir: Path) ->
     # Extract parent-child relationships
     parent_map = extract_parent_relationships(hierarchy)
     
+    # Group child IDs by parent URL in one pass over the parent map
+    children_by_parent = defaultdict(list)
+    for child_url, parent_url in parent_map.items():
+        children_by_parent[parent_url].append(url_to_filename(child_url).replace(".html", ""))
+    
+    # Only entries with both a URL and a file become documents
+    items = [item for item in urls_map if item.get("url") and item.get("file")]
+    
+    # Read the HTML files concurrently; this is I/O bound and map() keeps order
+    with ThreadPoolExecutor() as executor:
+        contents = list(executor.map(_read_html, (html_dir / item["file"] for item in items)))
+    
     # Create Document objects from the URLs map
-    for item in urls_map:
-        url = item.get("url", "")
-        filename = item.get("file", "")
+    for item, content in zip(items, contents):
+        url = item["url"]
+        filename = item["file"]
         title = item.get("title", "")
         
-        if not url or not filename:
-            continue
-        
         # Generate a stable ID from the URL
         doc_id = url_to_filename(url).replace(".html", "")
         
-        # Read the content from the HTML file
-        file_path = html_dir / filename
-        content = ""
-        if file_path.exists():
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-            except Exception as e:
-                logger.error(f"Error reading HTML file {filename}: {str(e)}")
-        
         # Create a document with the HTML content
         doc = Document(
             id=doc_id,
@@ -99,10 +112,7 @@ def create_documents_from_crawl(crawl_result: Dict[str, Any], html_dir: Path) ->
         )
         
         # Add child IDs
-        for child_url, parent_url in parent_map.items():
-            if parent_url == url:
-                child_id = url_to_filename(child_url).replace(".html", "")
-                doc.children_ids.append(child_id)
+        doc.children_ids.extend(children_by_parent.get(url, ()))
         
         documents.append(doc)
     
@@ -3,13 +3,12 @@ Main crawler functionality for ThinkMark.
 """
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-import json
-import jsonlines
 
 from scrapy.crawler import CrawlerProcess
 from scrapy.utils.project import get_project_settings
 
 from thinkmark.scrape.spiders.docs import DocsSpider
+from thinkmark.utils.json_io import load_json, load_jsonl
 
 
 def crawl_docs(
@@ -60,14 +59,11 @@ def crawl_docs(
     
     urls_map = []
     if urls_map_path.exists():
-        with jsonlines.open(urls_map_path) as reader:
-            for item in reader:
-                urls_map.append(item)
+        urls_map = load_jsonl(urls_map_path)
     
     hierarchy = {}
     if hierarchy_path.exists():
-        with open(hierarchy_path, 'r', encoding='utf-8') as f:
-            hierarchy = json.load(f)
+        hierarchy = load_json(hierarchy_path)
     
     return {
         "urls_map": urls_map,
@@ -62,7 +62,7 @@ def build_tree(
         }
         
         # Add all children
-        for child_url in children_map.get(url, []):
+        for child_url in children_map.get(url, ()):
             if child_url in pages:
                 child_node = build_subtree(child_url, depth + 1)
                 node["children"].append(child_node)
@@ -2,6 +2,8 @@
 Reusable URL-filter helpers.
 """
 import re
+from functools import lru_cache
+from typing import Iterable, Sequence, Tuple
 from urllib.parse import urlparse
 
 RAW_SOURCE_REGEX = re.compile(r"(/_sources/|/raw/|/source/|/_static/|/_downloads/)")
@@ -22,30 +24,80 @@ MEDIA_EXTENSIONS = (
 ALLOWED_EXTENSIONS = (".html", "/", "")
 
 
-def should_skip_url(url: str) -> bool:
+# Characters urlparse strips or treats specially inside the path
+_UNUSUAL_URL_CHARS = re.compile(r"[;\t\r\n]")
+
+
+@lru_cache(maxsize=4096)
+def _parse_url_path(url: str) -> str:
+    """Full urlparse fallback for URLs the fast path does not handle."""
+    return urlparse(url).path
+
+
+def _url_path(url: str) -> str:
+    """Return the path of a URL, as urlparse(url).path would.
+
+    Plain http(s) links are split with str methods instead of building a
+    ParseResult; anything else goes through urlparse.
+    """
+    if not url.startswith(("https://", "http://")) or _UNUSUAL_URL_CHARS.search(url):
+        return _parse_url_path(url)
+    rest = url.partition("://")[2]
+    # The path runs from the end of the host to the query or fragment
+    rest = rest.partition("#")[0].partition("?")[0]
+    slash = rest.find("/")
+    return rest[slash:] if slash >= 0 else ""
+
+
+def should_skip_url(url: str, allowed_extensions: Tuple[str, ...] = ALLOWED_EXTENSIONS) -> bool:
     """Determine if URL should be skipped based on extension and content type."""
     lower = url.lower()
-    if RAW_SOURCE_REGEX.search(lower) or SOURCE_FILE_REGEX.search(lower):
+    if RAW_SOURCE_REGEX.search(lower):
         return True
-    if any(lower.endswith(ext) for ext in MEDIA_EXTENSIONS):
+    # SOURCE_FILE_REGEX can only match URLs ending in ".txt"; checking the
+    # suffix first spares the regex scan for ordinary pages
+    if lower.endswith(".txt") and SOURCE_FILE_REGEX.search(lower):
         return True
-    parsed = urlparse(lower)
-    return not any(parsed.path.endswith(ext) for ext in ALLOWED_EXTENSIONS)
+    if lower.endswith(MEDIA_EXTENSIONS):
+        return True
+    # Every path ends with "", so when it is allowed the URL need not be parsed
+    if "" in allowed_extensions:
+        return False
+    return not _url_path(lower).endswith(allowed_extensions)
 
 
-def is_html_doc(url: str) -> bool:
+def is_html_doc(url: str, allowed_extensions: Tuple[str, ...] = ALLOWED_EXTENSIONS) -> bool:
     """Check if the URL likely points to an HTML document."""
-    parsed = urlparse(url)
-    return any(parsed.path.endswith(ext) for ext in (".html", "/", ""))
+    if "" in allowed_extensions:
+        return True
+    return _url_path(url).endswith(allowed_extensions)
+
 
+def should_follow_url(url: str, include: Sequence[str], exclude: Sequence[str]) -> bool:
+    """Determine if a URL should be followed based on inclusion/exclusion path rules.
 
-def should_follow_url(url: str, include: list[str], exclude: list[str]) -> bool:
-    """Determine if a URL should be followed based on inclusion/exclusion path rules."""
-    parsed = urlparse(url)
-    path = parsed.path
-    for ex in exclude:
-        if path.startswith(ex):
-            return False
+    Pass tuples to avoid a conversion per call; str.startswith checks every
+    prefix of a tuple in one C-level call.
+    """
+    path = _url_path(url)
+    if path.startswith(tuple(exclude)):
+        return False
     if include:
-        return any(path.startswith(inc) for inc in include)
+        return path.startswith(tuple(include))
     return True
+
+
+def compile_alternation(patterns: Iterable[str]) -> Tuple[re.Pattern, ...]:
+    """Compile regex patterns into a single alternation, dropping duplicates.
+
+    LinkExtractor searches every allow/deny pattern per link; one combined
+    pattern matches exactly when any of the originals would.
+    """
+    unique = list(dict.fromkeys(patterns))
+    if not unique:
+        return ()
+    try:
+        return (re.compile("|".join(f"(?:{pattern})" for pattern in unique)),)
+    except re.error:
+        # Patterns with inline global flags cannot be nested in a group
+        return tuple(re.compile(pattern) for pattern in unique)
@@ -1,11 +1,12 @@
 """
 Pipeline to build page hierarchy from parent-child relationships.
 """
-import json
+import logging
 from pathlib import Path
 from scrapy import Spider
 
 from thinkmark.scrape.hierarchy import build_tree
+from thinkmark.utils.json_io import load_json, save_json
 
 
 class HierarchyPipeline:
@@ -29,29 +30,31 @@ class HierarchyPipeline:
         # If the spider attributes are empty, try to load from files as fallback
         if not parent_map and parent_map_path.exists():
             try:
-                with open(parent_map_path, 'r', encoding='utf-8') as f:
-                    parent_map = json.load(f)
+                parent_map = load_json(parent_map_path)
                 spider.logger.info(f"[ThinkMark] Loaded parent map from file with {len(parent_map)} relationships")
             except Exception as e:
                 spider.logger.error(f"[ThinkMark] Error loading parent map: {str(e)}")
         
         if not page_info and page_info_path.exists():
             try:
-                with open(page_info_path, 'r', encoding='utf-8') as f:
-                    page_info = json.load(f)
+                page_info = load_json(page_info_path)
                 spider.logger.info(f"[ThinkMark] Loaded page info from file with {len(page_info)} pages")
             except Exception as e:
                 spider.logger.error(f"[ThinkMark] Error loading page info: {str(e)}")
                 
         spider.logger.info(f"[ThinkMark] Working with {len(parent_map)} parent-child relationships and {len(page_info)} pages")
             
-        # Extra debugging for root URL detection
-        child_urls = set(parent_map.keys())
-        potential_roots = [url for url in page_info.keys() if url not in child_urls]
-        spider.logger.info(f"[ThinkMark] Found {len(potential_roots)} potential root URLs")
+        # Extra debugging for root URL detection; without INFO logging we only
+        # need to know whether any root exists, so stop at the first one
+        if spider.logger.isEnabledFor(logging.INFO):
+            root_count = sum(1 for url in page_info if url not in parent_map)
+            spider.logger.info("[ThinkMark] Found %d potential root URLs", root_count)
+            has_root = root_count > 0
+        else:
+            has_root = any(url not in parent_map for url in page_info)
         
         # If no roots found from structure but we have page_info, manually add a root
-        if not potential_roots and page_info:
+        if not has_root and page_info:
             # Find URL that is most referred to as parent - it's likely the root
             parent_counts = {}
             for parent in parent_map.values():
@@ -69,29 +72,26 @@ class HierarchyPipeline:
         # Debug logging
         spider.logger.info(f"[ThinkMark] Building hierarchy from {len(parent_map)} parent-child relationships")
         
-        # Check for potential cycles in parent_map
-        for child, parent in parent_map.items():
-            if parent in parent_map and child in parent_map[parent]:
-                spider.logger.warning(f"[ThinkMark] POTENTIAL CYCLE DETECTED: {child} -> {parent} -> {child}")
-        
         # If both maps are empty, log a warning but continue with empty structures
         if not page_info and not parent_map:
             spider.logger.warning("[ThinkMark] Both page_info and parent_map are empty, hierarchy may be incomplete")
         
-        # Ensure page_info has entries for all URLs in parent_map
-        for url in set(parent_map.keys()).union(set(parent_map.values())):
-            if url not in page_info and url != "ROOT":
-                spider.logger.info(f"[ThinkMark] Adding missing page_info for {url}")
-                page_info[url] = {
-                    "url": url,
-                    "title": url.split('/')[-1] or "Home",
-                    "page": f"{url.replace('://', '-').replace('/', '-')}.md"
-                }
-        
-        # Check for self-references in parent_map
+        # One pass over parent_map: check for potential cycles and self-references,
+        # and ensure page_info has entries for all URLs in parent_map
         for child, parent in parent_map.items():
+            if parent in parent_map and child in parent_map[parent]:
+                spider.logger.warning(f"[ThinkMark] POTENTIAL CYCLE DETECTED: {child} -> {parent} -> {child}")
             if child == parent:
                 spider.logger.warning(f"[ThinkMark] SELF-REFERENCE DETECTED: {child} is its own parent")
+            
+            for url in (child, parent):
+                if url not in page_info and url != "ROOT":
+                    spider.logger.info(f"[ThinkMark] Adding missing page_info for {url}")
+                    page_info[url] = {
+                        "url": url,
+                        "title": url.split('/')[-1] or "Home",
+                        "page": f"{url.replace('://', '-').replace('/', '-')}.md"
+                    }
         
         # Log page_info for debugging
         spider.logger.info(f"[ThinkMark] Page info count: {len(page_info)}")
@@ -104,17 +104,16 @@ class HierarchyPipeline:
         except Exception as e:
             spider.logger.error(f"[ThinkMark] ERROR building hierarchy tree: {str(e)}")
             # Save empty hierarchy on error
-            with open(hierarchy_path, "w", encoding="utf-8") as f:
-                json.dump([], f)
+            save_json([], hierarchy_path, pretty=False)
             return
         
-        # Debug the hierarchy
-        if page_hierarchy and isinstance(page_hierarchy, dict):
-            summary = f"root: {page_hierarchy.get('title', 'N/A')}, children: {len(page_hierarchy.get('children', []))}"
-        else:
-            summary = 'empty'
-        spider.logger.info(f"[ThinkMark] Built hierarchy summary: {summary}")
+        # Debug the hierarchy (only build the summary if it will be logged)
+        if spider.logger.isEnabledFor(logging.INFO):
+            if page_hierarchy and isinstance(page_hierarchy, dict):
+                summary = f"root: {page_hierarchy.get('title', 'N/A')}, children: {len(page_hierarchy.get('children', []))}"
+            else:
+                summary = 'empty'
+            spider.logger.info("[ThinkMark] Built hierarchy summary: %s", summary)
         
         # Save hierarchy to JSON file
-        with open(hierarchy_path, "w", encoding="utf-8") as f:
-            json.dump(page_hierarchy, f, indent=2, ensure_ascii=False)
+        save_json(page_hierarchy, hierarchy_path)
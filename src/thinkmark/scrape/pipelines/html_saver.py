@@ -2,18 +2,26 @@
 Pipeline to save HTML content to files.
 """
 import os
-import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait as futures_wait
+from functools import partial
 from pathlib import Path
+from typing import Dict, Optional
 from urllib.parse import urlparse
 from slugify import slugify
-import jsonlines
 
 from scrapy import Spider
 from scrapy.exceptions import DropItem
 
 from thinkmark.scrape.items import PageItem
+from thinkmark.utils.json_io import save_json, save_jsonl
 from thinkmark.utils.url import url_to_filename
 
+# Threads writing raw HTML to disk off the reactor thread
+HTML_WRITE_WORKERS = 4
+# Flags matching open(path, "wb")
+_HTML_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 
 class HtmlSaverPipeline:
     """Pipeline that saves scraped HTML to disk and tracks page metadata."""
@@ -28,6 +36,48 @@ class HtmlSaverPipeline:
         self.output_dir = Path(spider.settings.get("OUTPUT_DIR", "output"))
         self.html_dir = self.output_dir / "raw_html"
         self.html_dir.mkdir(parents=True, exist_ok=True)
+        # Page bodies are written from a small thread pool so disk I/O does
+        # not block the crawl; close_spider waits for every write to finish
+        self._io_pool = ThreadPoolExecutor(max_workers=HTML_WRITE_WORKERS)
+        # Latest unfinished write per file, and files whose last write failed;
+        # both are also updated from the writer threads
+        self._pending_writes: Dict[Path, Future] = {}
+        self._failed_writes: Dict[Path, OSError] = {}
+        self._writes_lock = threading.Lock()
+
+    @staticmethod
+    def _write_html(filepath: Path, html: bytes) -> None:
+        """Write a page body to disk."""
+        # The body is written whole, so go straight to the file descriptor
+        # rather than through a buffered file object
+        fd = os.open(filepath, _HTML_OPEN_FLAGS, 0o666)
+        try:
+            view = memoryview(html)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    def _save_html(self, previous: Optional[Future], filepath: Path, html: bytes) -> None:
+        """Write a page body once any earlier write to the same file is done."""
+        if previous is not None:
+            # previous was submitted to the same FIFO pool earlier, so it is
+            # already running or finished and waiting here cannot deadlock
+            futures_wait([previous])
+        try:
+            self._write_html(filepath, html)
+        except OSError as e:
+            with self._writes_lock:
+                self._failed_writes[filepath] = e
+        else:
+            with self._writes_lock:
+                self._failed_writes.pop(filepath, None)
+
+    def _forget_write(self, filepath: Path, future: Future) -> None:
+        """Drop a finished write unless a later one to the same file replaced it."""
+        with self._writes_lock:
+            if self._pending_writes.get(filepath) is future:
+                del self._pending_writes[filepath]
 
     def process_item(self, item: PageItem, spider: Spider):
         """Process a scraped page item by saving HTML and recording metadata."""
@@ -36,28 +86,28 @@ class HtmlSaverPipeline:
 
         url = item["url"]
 
-        # Debug logging for parent relationship
-        parent_val = item.get("parent", None)
-        try:
-            spider.logger.info(f"[ThinkMark] Processing: {url} | parent: {parent_val}")
-        except Exception:
-            print(f"[ThinkMark] Processing: {url} | parent: {parent_val}")
-        
         # Create filename from URL
         filename = url_to_filename(url)
         filepath = self.html_dir / filename
         
-        # Save HTML content
-        with open(filepath, "wb") as f:
-            f.write(item["html"])
+        # Save HTML content in the background. When two URLs normalize to the
+        # same file, the second write waits for the first in its worker so the
+        # last one wins without blocking the crawl
+        with self._writes_lock:
+            previous = self._pending_writes.get(filepath)
+            future = self._io_pool.submit(self._save_html, previous, filepath, item["html"])
+            self._pending_writes[filepath] = future
+        future.add_done_callback(partial(self._forget_write, filepath))
         
         # Record for parent-child relationships
         # Always record parent relationship, except for the actual ROOT page
         if item["parent"] and item["parent"] != "ROOT":
             self.parent_map[url] = item["parent"]
-        # For debugging
-        spider.logger.info(f"[ThinkMark] Recording parent map: {url} -> {item.get('parent')}")
-        spider.logger.info(f"[ThinkMark] Parent map size: {len(self.parent_map)}")
+        # For debugging; lazy %-formatting so nothing is built unless DEBUG is on
+        spider.logger.debug(
+            "[ThinkMark] Saved %s | parent: %s | parent map size: %d",
+            url, item["parent"], len(self.parent_map),
+        )
         
         # Record URL mapping
         relpath = str(filepath.relative_to(self.output_dir))
@@ -78,20 +128,28 @@ class HtmlSaverPipeline:
     
     def close_spider(self, spider: Spider):
         """When spider finishes, save metadata to disk and always set hierarchy attributes."""
+        # Make sure every HTML file is on disk before anything reads them
+        self._io_pool.shutdown(wait=True)
+        if self._failed_writes:
+            failed_files = set()
+            for filepath, error in self._failed_writes.items():
+                spider.logger.error(f"[ThinkMark] Failed to save HTML: {error}")
+                failed_files.add(str(filepath.relative_to(self.output_dir)))
+            # Later stages read every file in the URLs map, so leave out the
+            # pages whose HTML never reached disk
+            failed_urls = {entry["url"] for entry in self.urls_map if entry["file"] in failed_files}
+            self.urls_map = [entry for entry in self.urls_map if entry["url"] not in failed_urls]
+            for url in failed_urls:
+                self.page_info.pop(url, None)
+                self.parent_map.pop(url, None)
+            self._failed_writes = {}
+        
         # Save URL to filename mapping
-        urls_map_path = self.output_dir / "urls_map.jsonl"
-        with jsonlines.open(urls_map_path, mode="w") as writer:
-            writer.write_all(self.urls_map)
+        save_jsonl(self.urls_map, self.output_dir / "urls_map.jsonl")
             
         # Save parent map and page info to JSON files for cross-pipeline access
-        parent_map_path = self.output_dir / "parent_map.json"
-        page_info_path = self.output_dir / "page_info.json"
-        
-        with open(parent_map_path, "w", encoding="utf-8") as f:
-            json.dump(self.parent_map, f, indent=2)
-            
-        with open(page_info_path, "w", encoding="utf-8") as f:
-            json.dump(self.page_info, f, indent=2)
+        save_json(self.parent_map, self.output_dir / "parent_map.json")
+        save_json(self.page_info, self.output_dir / "page_info.json")
             
         # Log completion message
         spider.logger.info(f"[ThinkMark] Saved metadata: {len(self.parent_map)} parent-child relations, {len(self.page_info)} pages")
@@ -1,7 +1,11 @@
 """
 Thin crawling spider – *only* decides what to fetch.
 """
+from functools import lru_cache
+from urllib.parse import urlparse
+
 import scrapy
+from scrapy.http import TextResponse
 from scrapy.linkextractors import LinkExtractor
 
 from thinkmark.scrape.items import PageItem
@@ -10,6 +14,7 @@ from thinkmark.scrape.link_filters import (
     should_skip_url,
     should_follow_url,
     is_html_doc,
+    compile_alternation,
 )
 from thinkmark.utils.url import (
     normalize_url,
@@ -17,6 +22,17 @@ from thinkmark.utils.url import (
 )
 
 
+@lru_cache(maxsize=4096)
+def _title_from_url(url: str) -> str:
+    """Extract a title from a URL, reusing results for repeated URLs."""
+    p = urlparse(url)
+    path = p.path.rstrip("/")
+    if not path:
+        return "Home"
+    last = path.split("/")[-1]
+    return last.replace("-", " ").replace("_", " ").title()
+
+
 class DocsSpider(scrapy.Spider):
     name = "docs"
 
@@ -33,11 +49,17 @@ class DocsSpider(scrapy.Spider):
         self.cfg = config
         self.root_url = normalize_url(start_url)  # Store the root URL for hierarchy building
 
+        # Path prefix rules as tuples, checked for every extracted link
+        self.include_paths = tuple(self.cfg.get("include_paths") or ())
+        self.exclude_paths = tuple(self.cfg.get("exclude_paths") or ())
+
         self.link_extractor = LinkExtractor(
             allow_domains=self.cfg.get("allowed_domains", []),
-            allow=self.cfg.get("include_paths", []) or (),
-            deny=self.cfg.get("exclude_paths", [])
-            + [r"/_sources/", r"/raw/", r"/source/", r"/_static/", r"/_downloads/"],
+            allow=compile_alternation(self.include_paths),
+            deny=compile_alternation(
+                self.exclude_paths
+                + (r"/_sources/", r"/raw/", r"/source/", r"/_static/", r"/_downloads/")
+            ),
             canonicalize=True,
             strip=True,
         )
@@ -51,12 +73,15 @@ class DocsSpider(scrapy.Spider):
 
         canonical = normalize_url(url)
         
-        # Check if response is text or binary
-        try:
-            title = response.css("title::text").get() or self._url_to_title(url)
-        except Exception as e:
+        # Check if response is text or binary once; binary responses have no
+        # DOM, and probing them raises an exception inside Scrapy
+        is_text = isinstance(response, TextResponse)
+        if is_text:
+            # XPath directly, skipping the CSS-to-XPath translation per page
+            title = response.xpath("//title/text()").get() or self._url_to_title(url)
+        else:
             # For non-text responses, just use the URL as title
-            self.logger.info(f"Non-text response for {url}: {str(e)}")
+            self.logger.info(f"Non-text response for {url}")
             title = self._url_to_title(url)
 
         # Determine parent URL - for root page, use "ROOT" as parent
@@ -78,7 +103,7 @@ class DocsSpider(scrapy.Spider):
             return
 
         # Only extract links from text responses
-        if not hasattr(response, 'text'):
+        if not is_text:
             self.logger.info(f"Skipping link extraction for non-text response: {url}")
             return
             
@@ -86,9 +111,7 @@ class DocsSpider(scrapy.Spider):
             for link in self.link_extractor.extract_links(response):
                 if should_skip_url(link.url) or not is_html_doc(link.url):
                     continue
-                if not should_follow_url(link.url, 
-                                        self.cfg.get("include_paths", []), 
-                                        self.cfg.get("exclude_paths", [])):
+                if not should_follow_url(link.url, self.include_paths, self.exclude_paths):
                     continue
                 # Always pass the current page's canonical URL as the parent for the next page
                 yield scrapy.Request(
@@ -102,10 +125,4 @@ class DocsSpider(scrapy.Spider):
     
     def _url_to_title(self, url: str) -> str:
         """Extract a title from a URL."""
-        from urllib.parse import urlparse
-        p = urlparse(url)
-        path = p.path.rstrip("/")
-        if not path:
-            return "Home"
-        last = path.split("/")[-1]
-        return last.replace("-", " ").replace("_", " ").title()
+        return _title_from_url(url)
@@ -26,8 +26,7 @@ def get_config(config_file: Optional[Path], start_url: Optional[str] = None) ->
             config["allowed_domains"] = [parsed.netloc]
 
     # Ensure all expected keys exist
-    for key in DEFAULT_CONFIG:
-        if key not in config:
-            config[key] = DEFAULT_CONFIG[key]
+    for key, default in DEFAULT_CONFIG.items():
+        config.setdefault(key, default)
 
     return config
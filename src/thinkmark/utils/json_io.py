@@ -1,38 +1,50 @@
 """JSON and JSONL file handling utilities."""
 
 import json
-import jsonlines
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+# Same encoder settings jsonlines uses by default, so output is unchanged
+_JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 def load_json(file_path: Path) -> Dict[str, Any]:
     """Load JSON data from file."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # json.loads accepts the raw bytes, so the file is read in one call
+    return json.loads(Path(file_path).read_bytes())
 
 def save_json(data: Dict[str, Any], file_path: Path, pretty: bool = True) -> None:
     """Save data to JSON file."""
     # Create parent directory if it doesn't exist
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Encode the whole document first and write it in one call, instead of
+    # the many small writes json.dump makes while encoding
+    if pretty:
+        encoded = json.dumps(data, indent=2, ensure_ascii=False)
+    else:
+        encoded = json.dumps(data, ensure_ascii=False)
     with open(file_path, "w", encoding="utf-8") as f:
-        if pretty:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        else:
-            json.dump(data, f, ensure_ascii=False)
+        f.write(encoded)
 
 def load_jsonl(file_path: Path) -> List[Dict[str, Any]]:
     """Load JSONL data from file."""
-    items = []
-    with jsonlines.open(file_path) as reader:
-        for item in reader:
-            items.append(item)
-    return items
+    # Read the file once and parse each non-blank line. Split on "\n" only:
+    # str.splitlines would also break on U+2028 and friends, which
+    # ensure_ascii=False leaves unescaped inside strings.
+    return [
+        json.loads(line)
+        for line in Path(file_path).read_text(encoding="utf-8").split("\n")
+        if line.strip()
+    ]
 
 def save_jsonl(data: List[Dict[str, Any]], file_path: Path) -> None:
     """Save data to JSONL file."""
     # Create parent directory if it doesn't exist
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with jsonlines.open(file_path, mode="w") as writer:
-        writer.write_all(data)
+    # Encode every record up front and hand the file a single buffer instead
+    # of two small writes per record
+    lines = [_JSONL_ENCODER.encode(item) for item in data]
+    lines.append("")
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
@@ -0,0 +1,11 @@
+"""Text helpers shared across pipeline stages."""
+
+import re
+
+# Rich formatting tags that might appear in markdown code blocks, matched in one pass
+RICH_TAG_PATTERN = re.compile(r"\[/?(?:bold|italic|code|red|green|blue)\]")
+
+
+def escape_rich_tags(text: str) -> str:
+    """Escape Rich formatting tags in text to prevent markup errors."""
+    return RICH_TAG_PATTERN.sub(r"\\\g<0>", text)
@@ -1,16 +1,41 @@
 """URL handling utilities."""
 
-from urllib.parse import urlparse, urljoin, urldefrag
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlparse, urljoin, urldefrag, urlsplit, urlunsplit, uses_params
 from typing import Optional, List
 import re
 from slugify import slugify # Moved import here
 
+
+# Text already in slug form, which slugify returns unchanged
+SLUG_PATTERN = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+
+@lru_cache(maxsize=8192)
+def _cached_slugify(text: str) -> str:
+    """Memoized slugify; every page of a site shares the same domain slug."""
+    # Most documentation paths are already lowercase words and hyphens, so
+    # skip slugify's unicode normalization and regex passes for them
+    if SLUG_PATTERN.fullmatch(text):
+        return text
+    return slugify(text)
+
+
 def normalize_url(url: str) -> str:
     """Normalize a URL by removing fragments and ensuring no trailing slashes on the path, except for the root."""
-    url_no_frag, _ = urldefrag(url)
-    parsed = urlparse(url_no_frag)
+    # Most links carry no fragment, so urldefrag's extra parse is only paid
+    # when there is one. A single urlsplit replaces urlparse; the ";params"
+    # urlparse would split off the last path segment are dropped by hand.
+    if "#" in url:
+        url, _ = urldefrag(url)
+    parsed = urlsplit(url)
     
     current_path = parsed.path
+    if parsed.scheme in uses_params:
+        params_start = current_path.find(";", current_path.rfind("/") + 1)
+        if params_start >= 0:
+            current_path = current_path[:params_start]
     
     # If the path is not the root path ("/") and ends with a slash, remove the trailing slash.
     if current_path != "/" and current_path.endswith("/"):
@@ -19,7 +44,7 @@ def normalize_url(url: str) -> str:
         # Preserve the path if it's the root ("/") or already has no trailing slash (e.g. "/path", "")
         new_path = current_path
         
-    return parsed._replace(path=new_path, fragment="", params="", query=parsed.query).geturl()
+    return urlunsplit((parsed.scheme, parsed.netloc, new_path, parsed.query, ""))
 
 
 def is_url_allowed(
@@ -35,12 +60,12 @@ def is_url_allowed(
     if allowed_domains and parsed.netloc not in allowed_domains:
         return False
 
-    # Check excluded paths
-    if exclude_paths and any(parsed.path.startswith(path) for path in exclude_paths):
+    # Check excluded paths; startswith tests a whole tuple of prefixes in C
+    if exclude_paths and parsed.path.startswith(tuple(exclude_paths)):
         return False
 
     # Check included paths
-    if include_paths and not any(parsed.path.startswith(path) for path in include_paths):
+    if include_paths and not parsed.path.startswith(tuple(include_paths)):
         return False
 
     return True
@@ -62,14 +87,14 @@ def url_to_filename(url: str, is_dir: bool = False) -> str:
     
     # For directory names, we want just the domain
     if is_dir:
-        return slugify(domain)
+        return _cached_slugify(domain)
         
     # For filenames, include the path components
     if path:
         # Replace slashes in path with hyphens before slugifying
         processed_path = path.replace('/', '-')
-        return f"{slugify(domain)}-{slugify(processed_path)}.html"
-    return f"{slugify(domain)}.html"
+        return f"{_cached_slugify(domain)}-{_cached_slugify(processed_path)}.html"
+    return f"{_cached_slugify(domain)}.html"
 
 
 def get_site_directory(url: str, base_dir: str = None) -> str:
@@ -82,8 +107,6 @@ def get_site_directory(url: str, base_dir: str = None) -> str:
     Returns:
         Absolute path to the site's directory
     """
-    from pathlib import Path
-    
     dir_name = url_to_filename(url, is_dir=True)
     if base_dir:
         return str(Path(base_dir).resolve() / dir_name)
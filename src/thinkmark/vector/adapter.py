@@ -46,7 +46,7 @@ def prepare_documents_for_indexing(state: PipelineState) -> Path:
             metadata_str = f"---\ntitle: {doc.title}\nurl: {doc.url}\nsite_name: {state.site_url}\n---\n\n"
             
             with open(doc_path, "w", encoding="utf-8") as f:
-                f.write(metadata_str + doc.content)
+                f.writelines((metadata_str, doc.content))
     
     return temp_dir
 
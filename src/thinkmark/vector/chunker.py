@@ -3,6 +3,7 @@ Chunking + vector-index helpers for ThinkMark docs.
 Enhanced chunking with multi-layered approach (semantic, sentence-based, hierarchical)
 and content-type awareness (code, explanation, mixed).
 """
+import os
 import re
 from pathlib import Path
 from typing import List, Dict, Union, Tuple, Optional, ClassVar, Any
@@ -20,7 +21,7 @@ from thinkmark.utils.json_io import load_json
 
 # Import modularized components
 from thinkmark.vector.content_detection import detect_content_type
-from thinkmark.vector.metadata_enrichment import enrich_node_metadata
+from thinkmark.vector.metadata_enrichment import enrich_nodes_metadata
 from thinkmark.vector.chunking_strategies import create_enhanced_chunker
 
 logger = configure_logging(module_name="thinkmark.vector.chunker")
@@ -225,10 +226,15 @@ class StructureAwareNodeParser(NodeParser):
     
     def _should_split_section(self, section_text: str) -> bool:
         """Check if a section is too large and needs splitting."""
+        limit = self.chunk_size * 1.5  # Add some buffer
+        # Words need a separator between them, so a section can hold at most
+        # (len + 1) // 2 of them; short sections never need the split below
+        if (len(section_text) + 1) // 2 <= limit:
+            return False
         # Simple token count estimate based on whitespace
         # This is a heuristic - a real tokenizer would be more accurate
         tokens = len(section_text.split())
-        return tokens > self.chunk_size * 1.5  # Add some buffer
+        return tokens > limit
     
     def _create_node_from_section(
         self, 
@@ -386,10 +392,9 @@ class Chunker:
             # Chunk the document
             nodes = chunker.get_nodes_from_documents([doc])
             
-            # Enrich metadata for each node
-            for node in nodes:
-                file_path = doc.metadata.get('file_path', doc.metadata.get('file_name', ''))
-                enrich_node_metadata(node, file_path, hierarchy_data)
+            # Enrich metadata for all nodes of this document
+            file_path = doc.metadata.get('file_path', doc.metadata.get('file_name', ''))
+            enrich_nodes_metadata(nodes, file_path, hierarchy_data)
             
             all_nodes.extend(nodes)
         
@@ -449,14 +454,17 @@ class Chunker:
             input_dir.parent / "hierarchy.json"
         ]
         
-        # If input_dir has site directories, check each one
-        if not any(p.name == 'annotated' for p in input_dir.iterdir() if p.is_dir()):
-            for site_dir in input_dir.iterdir():
-                if site_dir.is_dir():
-                    potential_paths.extend([
-                        site_dir / "page_hierarchy.json",
-                        site_dir / "hierarchy.json"
-                    ])
+        # If input_dir has site directories, check each one. A single scandir
+        # pass lists the subdirectories without a stat call per entry.
+        with os.scandir(input_dir) as entries:
+            subdirs = [entry.name for entry in entries if entry.is_dir()]
+        if 'annotated' not in subdirs:
+            for name in subdirs:
+                site_dir = input_dir / name
+                potential_paths.extend([
+                    site_dir / "page_hierarchy.json",
+                    site_dir / "hierarchy.json"
+                ])
         
         # Try to load from any of the potential paths
         for path in potential_paths:
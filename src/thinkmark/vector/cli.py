@@ -164,8 +164,10 @@ def info(
             raise typer.Exit(code=1)
             
         # Extract index metadata
-        doc_count = len(index.docstore.docs) if hasattr(index, 'docstore') and hasattr(index.docstore, 'docs') else "Unknown"
-        source = index.metadata.get("source", "Unknown") if hasattr(index, 'metadata') else "Unknown"
+        docs = getattr(getattr(index, 'docstore', None), 'docs', None)
+        doc_count = len(docs) if docs is not None else "Unknown"
+        metadata = getattr(index, 'metadata', None)
+        source = metadata.get("source", "Unknown") if metadata is not None else "Unknown"
         
         logger.debug(f"Index contains {doc_count} documents from source: {source}")
         
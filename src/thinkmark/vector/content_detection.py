@@ -3,9 +3,13 @@ Content type detection for ThinkMark document processing.
 Classifies content as code, explanation, or mixed.
 """
 import re
+from functools import lru_cache
 from typing import Literal
 
 
+# Chunks of one document often repeat its full text (single-chunk pages,
+# parent nodes), so remember recent classifications keyed on the text itself
+@lru_cache(maxsize=1024)
 def detect_content_type(text: str) -> Literal['code', 'explanation', 'mixed']:
     """
     Determine the type of content based on text analysis.
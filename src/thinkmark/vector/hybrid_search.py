@@ -81,8 +81,10 @@ def filter_results_by_metadata(
     
     for node in retrieval_results:
         # Check score threshold if specified
-        if min_score is not None and hasattr(node, 'score') and node.score < min_score:
-            continue
+        if min_score is not None:
+            score = getattr(node, 'score', None)
+            if score is not None and score < min_score:
+                continue
             
         # Apply metadata filters
         match = True
@@ -4,12 +4,76 @@ Enhances nodes with hierarchical and structural information.
 """
 
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, FrozenSet, List, Tuple, Union
 
 from llama_index.core.schema import TextNode
 from thinkmark.vector.content_detection import detect_content_type
 
 
+# Lookup tables for the most recently seen hierarchy, keyed on its identity
+_hierarchy_index_cache: Tuple[Any, Dict[str, List[str]], Dict[str, str]] = (None, {}, {})
+
+
+def _build_hierarchy_index(
+    hierarchy_data: Dict[str, Any]
+) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+    """
+    Flatten the hierarchy into file -> breadcrumb and file -> section tables.
+
+    Walks the tree once in pre-order and records, for every file, the result a
+    depth-first search for that file would return.
+    Results for the last hierarchy object seen are cached.
+
+    Args:
+        hierarchy_data: Hierarchy data from page_hierarchy.json
+
+    Returns:
+        Tuple of (breadcrumb parts by file, section by file)
+    """
+    global _hierarchy_index_cache
+    if _hierarchy_index_cache[0] is hierarchy_data:
+        return _hierarchy_index_cache[1], _hierarchy_index_cache[2]
+
+    breadcrumbs: Dict[str, List[str]] = {}
+    sections: Dict[str, str] = {}
+
+    # A match with an empty result ends the search below that node, so files
+    # matched that way are blocked for the rest of the subtree.
+    no_files: FrozenSet[str] = frozenset()
+    stack = [(hierarchy_data, (), None, no_files, no_files)]
+    while stack:
+        node, ancestor_titles, section, crumb_blocked, section_blocked = stack.pop()
+        if section is None and 'title' in node:
+            section = node['title']
+
+        file_name = node.get('file')
+        if isinstance(file_name, str):
+            if file_name not in breadcrumbs and file_name not in crumb_blocked:
+                parts = list(ancestor_titles)
+                if 'title' in node:
+                    parts.append(node['title'])
+                if parts:
+                    breadcrumbs[file_name] = parts
+                else:
+                    crumb_blocked = crumb_blocked | {file_name}
+            if file_name not in sections and file_name not in section_blocked:
+                if section:
+                    sections[file_name] = section
+                else:
+                    section_blocked = section_blocked | {file_name}
+
+        children = node.get('children')
+        if isinstance(children, list):
+            child_titles = ancestor_titles + (node['title'],) if 'title' in node else ancestor_titles
+            # Push in reverse so children are visited in document order
+            for child in reversed(children):
+                child_section = section if 'section' not in child else child.get('title', section)
+                stack.append((child, child_titles, child_section, crumb_blocked, section_blocked))
+
+    _hierarchy_index_cache = (hierarchy_data, breadcrumbs, sections)
+    return breadcrumbs, sections
+
+
 def extract_breadcrumb(file_path: Union[str, Path], hierarchy_data: Dict[str, Any]) -> str:
     """
     Extract breadcrumb navigation from file path using hierarchy data.
@@ -29,39 +93,13 @@ def extract_breadcrumb(file_path: Union[str, Path], hierarchy_data: Dict[str, An
     # Try to find the file in the hierarchy
     breadcrumb_parts = []
     
-    def traverse_hierarchy(node, path_to_match, current_path=None):
-        if current_path is None:
-            current_path = []
-        
-        # Check if this node matches our target
-        if node.get('file') == path_to_match:
-            # Found the file, collect the breadcrumb
-            parts = []
-            for ancestor in current_path:
-                if 'title' in ancestor:
-                    parts.append(ancestor['title'])
-            if 'title' in node:
-                parts.append(node['title'])
-            return parts
-        
-        # Check children if this node has any
-        if 'children' in node and isinstance(node['children'], list):
-            for child in node['children']:
-                result = traverse_hierarchy(
-                    child, 
-                    path_to_match, 
-                    current_path + [node] if 'title' in node else current_path
-                )
-                if result:
-                    return result
-        
-        return None
-    
     # Try different path formats (full path, relative path, filename only)
-    for potential_path in [file_path, Path(file_path).name]:
-        if hierarchy_data:
-            breadcrumb_parts = traverse_hierarchy(hierarchy_data, potential_path)
+    if hierarchy_data:
+        breadcrumbs, _ = _build_hierarchy_index(hierarchy_data)
+        for potential_path in [file_path, Path(file_path).name]:
+            breadcrumb_parts = breadcrumbs.get(potential_path)
             if breadcrumb_parts:
+                breadcrumb_parts = list(breadcrumb_parts)
                 break
     
     # If we couldn't find in hierarchy, construct from path
@@ -97,34 +135,12 @@ def extract_section_from_hierarchy(file_path: Union[str, Path], hierarchy_data:
     """
     file_path = str(file_path) if isinstance(file_path, Path) else file_path
     
-    # Helper function to find the file in hierarchy
-    def find_in_hierarchy(node, path_to_match, current_section=None):
-        # Set default current section
-        if current_section is None and 'title' in node:
-            current_section = node['title']
-        
-        # Check if this node matches our target
-        if node.get('file') == path_to_match:
-            return current_section
-        
-        # Check children if this node has any
-        if 'children' in node and isinstance(node['children'], list):
-            for child in node['children']:
-                result = find_in_hierarchy(
-                    child, 
-                    path_to_match, 
-                    current_section if 'section' not in child else child.get('title', current_section)
-                )
-                if result:
-                    return result
-        
-        return None
-    
     # Try different path formats
     section = None
-    for potential_path in [file_path, Path(file_path).name]:
-        if hierarchy_data:
-            section = find_in_hierarchy(hierarchy_data, potential_path)
+    if hierarchy_data:
+        _, sections = _build_hierarchy_index(hierarchy_data)
+        for potential_path in [file_path, Path(file_path).name]:
+            section = sections.get(potential_path)
             if section:
                 break
     
@@ -146,17 +162,16 @@ def extract_section_from_hierarchy(file_path: Union[str, Path], hierarchy_data:
     return section
 
 
-def enrich_node_metadata(node: TextNode, file_path: Union[str, Path], hierarchy_data: Dict[str, Any]) -> TextNode:
+def _document_metadata(file_path: Union[str, Path], hierarchy_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Enrich node metadata with information from file path and hierarchy.
+    Compute the metadata shared by every node of a document.
     
     Args:
-        node: The node to enrich
         file_path: Path to the source file
         hierarchy_data: Hierarchy data from page_hierarchy.json
         
     Returns:
-        Enriched node with updated metadata
+        Dict with file_path, section_depth, breadcrumb and doc_section
     """
     # Ensure file_path is a string
     file_path_str = str(file_path) if isinstance(file_path, Path) else file_path
@@ -166,26 +181,64 @@ def enrich_node_metadata(node: TextNode, file_path: Union[str, Path], hierarchy_
     section_depth = len(path_parts) - 1 if len(path_parts) > 0 else 0
     
     # Get structural metadata
-    breadcrumb = extract_breadcrumb(file_path_str, hierarchy_data)
-    doc_section = extract_section_from_hierarchy(file_path_str, hierarchy_data)
-    
-    # Determine content type
-    content_type = detect_content_type(node.text)
+    return {
+        'file_path': file_path_str,
+        'section_depth': section_depth,
+        'breadcrumb': extract_breadcrumb(file_path_str, hierarchy_data),
+        'doc_section': extract_section_from_hierarchy(file_path_str, hierarchy_data)
+    }
+
+
+def _apply_node_metadata(node: TextNode, doc_metadata: Dict[str, Any]) -> TextNode:
+    """Add document-level and node-specific metadata to a node."""
+    breadcrumb = doc_metadata['breadcrumb']
     
     # Get parent section from existing metadata or construct it
     parent_section = node.metadata.get('heading', '')
     if not parent_section and breadcrumb:
-        breadcrumb_parts = breadcrumb.split(' > ')
-        parent_section = breadcrumb_parts[-1] if len(breadcrumb_parts) > 0 else ''
+        parent_section = breadcrumb.rpartition(' > ')[2]
     
     # Update metadata
     node.metadata.update({
-        'file_path': file_path_str,
-        'section_depth': section_depth,
+        'file_path': doc_metadata['file_path'],
+        'section_depth': doc_metadata['section_depth'],
         'breadcrumb': breadcrumb,
-        'content_type': content_type,
+        'content_type': detect_content_type(node.text),
         'parent_section': parent_section,
-        'doc_section': doc_section
+        'doc_section': doc_metadata['doc_section']
     })
     
     return node
+
+
+def enrich_node_metadata(node: TextNode, file_path: Union[str, Path], hierarchy_data: Dict[str, Any]) -> TextNode:
+    """
+    Enrich node metadata with information from file path and hierarchy.
+    
+    Args:
+        node: The node to enrich
+        file_path: Path to the source file
+        hierarchy_data: Hierarchy data from page_hierarchy.json
+        
+    Returns:
+        Enriched node with updated metadata
+    """
+    return _apply_node_metadata(node, _document_metadata(file_path, hierarchy_data))
+
+
+def enrich_nodes_metadata(nodes: List[TextNode], file_path: Union[str, Path], hierarchy_data: Dict[str, Any]) -> List[TextNode]:
+    """
+    Enrich all nodes of one document, computing the shared metadata once.
+    
+    Args:
+        nodes: Nodes chunked from the same source file
+        file_path: Path to the source file
+        hierarchy_data: Hierarchy data from page_hierarchy.json
+        
+    Returns:
+        The enriched nodes
+    """
+    doc_metadata = _document_metadata(file_path, hierarchy_data)
+    for node in nodes:
+        _apply_node_metadata(node, doc_metadata)
+    return nodes
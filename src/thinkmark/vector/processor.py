@@ -12,6 +12,7 @@ from typing import List, Optional, Dict, Any
 import faiss
 
 from llama_index.core import (
+    Settings,
     SimpleDirectoryReader,
     StorageContext,
     VectorStoreIndex,
@@ -28,6 +29,70 @@ from thinkmark.utils.logging import configure_logging, log_exception
 # Configure module logger
 logger = configure_logging(module_name="thinkmark.vector.processor")
 
+# Nodes embedded and added to the vector store per batch while building an
+# index; smaller batches cap peak memory, larger ones mean fewer store writes
+INSERT_BATCH_SIZE = int(os.getenv("THINKMARK_INSERT_BATCH_SIZE", "512"))
+
+# Default chunking parameters and the embedding dimension of the Faiss index
+DEFAULT_CHUNK_SIZE = 1024
+DEFAULT_CHUNK_OVERLAP = 20
+EMBEDDING_DIMENSION = 1536  # Default OpenAI embedding dimension
+# Embedding model llama_index uses when none is configured on Settings
+DEFAULT_EMBEDDING_MODEL = "OpenAIEmbedding:text-embedding-ada-002"
+
+
+def _configured_embedding_model() -> str:
+    """
+    Name the embedding model explicitly configured on llama_index Settings.
+    
+    Returns:
+        "ClassName:model_name" for a configured model, or
+        DEFAULT_EMBEDDING_MODEL when none is configured
+    """
+    # Settings.embed_model builds the default model when none is set (and
+    # raises without an API key), so read the configured one unresolved
+    embed_model = getattr(Settings, "_embed_model", None)
+    if embed_model is None:
+        logger.debug(f"No embedding model configured, assuming {DEFAULT_EMBEDDING_MODEL}")
+        return DEFAULT_EMBEDDING_MODEL
+    
+    model_name = getattr(embed_model, "model_name", None)
+    if not model_name:
+        logger.warning(
+            f"Embedding model {type(embed_model).__name__} has no model_name; "
+            "identifying it by class name only"
+        )
+        return type(embed_model).__name__
+    return f"{type(embed_model).__name__}:{model_name}"
+
+
+def index_build_settings(
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+    embedding_model: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Describe the settings an index is built with.
+    
+    A persisted index built with different settings is stale even when the
+    input documents are unchanged.
+    
+    Args:
+        chunk_size: Maximum chunk size for the splitter
+        chunk_overlap: Overlap between chunks
+        embedding_model: Name of the embedding model (defaults to the model
+            configured on llama_index Settings)
+        
+    Returns:
+        JSON-serializable dictionary of the build settings
+    """
+    return {
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "embedding_dimension": EMBEDDING_DIMENSION,
+        "embedding_model": embedding_model or _configured_embedding_model(),
+    }
+
 
 def _chunk_documents(input_dir: Path, chunk_size: int, chunk_overlap: int):
     """
@@ -55,8 +120,8 @@ def _chunk_documents(input_dir: Path, chunk_size: int, chunk_overlap: int):
 def build_index(
     input_dir: Path,
     persist_dir: Path,
-    chunk_size: int = 1024,
-    chunk_overlap: int = 20,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
     rebuild: bool = False,
     index_metadata: Optional[Dict[str, Any]] = None,
 ):
@@ -118,8 +183,7 @@ def build_index(
     # 4. Create the vector store and index
     try:
         # Create a FAISS index for vector storage
-        dimension = 1536  # Default OpenAI embedding dimension
-        faiss_index = faiss.IndexFlatL2(dimension)
+        faiss_index = faiss.IndexFlatL2(EMBEDDING_DIMENSION)
         vector_store = FaissVectorStore(faiss_index=faiss_index)
         
         # Initialize with empty stores to avoid loading from disk
@@ -148,6 +212,7 @@ def build_index(
         index = VectorStoreIndex(
             nodes, 
             storage_context=storage_ctx,
+            insert_batch_size=INSERT_BATCH_SIZE,
             metadata=metadata
         )
         
@@ -0,0 +1,38 @@
+import pytest
+
+from thinkmark.core.pipeline import _fingerprint_index_inputs
+
+
+class TestFingerprintIndexInputs:
+    """Test cases for deciding when a persisted vector index is stale."""
+
+    @pytest.fixture
+    def annotated_dir(self, tmp_path):
+        """Create an annotated directory with one page and a hierarchy beside it."""
+        annotated_dir = tmp_path / "annotated"
+        annotated_dir.mkdir()
+        (annotated_dir / "page.md").write_text("# Page\n\nBody", encoding="utf-8")
+        (tmp_path / "hierarchy.json").write_text('{"title": "Root"}', encoding="utf-8")
+        return annotated_dir
+
+    @pytest.fixture
+    def settings(self):
+        """Build settings as returned by index_build_settings."""
+        return {"chunk_size": 1024, "chunk_overlap": 20, "embedding_model": "OpenAIEmbedding:x"}
+
+    def test_fingerprint_stable(self, annotated_dir, settings):
+        """Test that unchanged inputs give the same fingerprint."""
+        assert _fingerprint_index_inputs(annotated_dir, settings) == _fingerprint_index_inputs(annotated_dir, dict(settings))
+
+    def test_fingerprint_changes_with_hierarchy(self, annotated_dir, settings):
+        """Test that editing the hierarchy beside the docs invalidates the index."""
+        before = _fingerprint_index_inputs(annotated_dir, settings)
+        (annotated_dir.parent / "hierarchy.json").write_text('{"title": "New root"}', encoding="utf-8")
+
+        assert _fingerprint_index_inputs(annotated_dir, settings) != before
+
+    def test_fingerprint_changes_with_settings(self, annotated_dir, settings):
+        """Test that different build settings invalidate the index."""
+        before = _fingerprint_index_inputs(annotated_dir, settings)
+
+        assert _fingerprint_index_inputs(annotated_dir, {**settings, "chunk_size": 512}) != before
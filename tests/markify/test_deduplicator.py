@@ -0,0 +1,51 @@
+from thinkmark.markify.deduplicator import Deduplicator
+
+
+class TestDeduplicate:
+    """Test cases for cross-page deduplication."""
+
+    def _write_pages(self, directory, texts):
+        """Write one Markdown file per text and return the processed entries."""
+        processed_files = []
+        for i, text in enumerate(texts):
+            filename = f"page-{i}.md"
+            (directory / filename).write_text(text, encoding="utf-8")
+            processed_files.append(({"url": f"https://example.com/{i}"}, {"file": filename}))
+        return processed_files
+
+    def test_deduplicate_exact_duplicates(self, tmp_path):
+        """Test that only the first of identical pages is kept."""
+        processed_files = self._write_pages(tmp_path, [
+            "Installation guide for the command line client",
+            "Configuration reference for every server option",
+            "Installation guide for the command line client",
+        ])
+
+        result = Deduplicator().deduplicate(processed_files, tmp_path)
+
+        assert [new["file"] for _, new in result] == ["page-0.md", "page-1.md"]
+
+    def test_deduplicate_near_duplicates_keep_longer(self, tmp_path):
+        """Test that of two near-identical pages the longer one is kept."""
+        shared = "streaming responses tokens batching retries timeouts authentication headers"
+        processed_files = self._write_pages(tmp_path, [
+            shared,
+            "vector indexes embeddings similarity search chunking overlap metadata",
+            shared + " headers",
+        ])
+
+        result = Deduplicator(similarity_threshold=0.9).deduplicate(processed_files, tmp_path)
+
+        assert [new["file"] for _, new in result] == ["page-1.md", "page-2.md"]
+
+    def test_deduplicate_distinct_pages_kept(self, tmp_path):
+        """Test that unrelated pages are all kept in their original order."""
+        processed_files = self._write_pages(tmp_path, [
+            "installing packages with pip and virtual environments",
+            "writing spiders that follow documentation links",
+            "converting html pages into clean markdown files",
+        ])
+
+        result = Deduplicator().deduplicate(processed_files, tmp_path)
+
+        assert result == processed_files
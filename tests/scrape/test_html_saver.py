@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from thinkmark.scrape.items import PageItem
+from thinkmark.scrape.pipelines.html_saver import HtmlSaverPipeline
+from thinkmark.utils.json_io import load_json, load_jsonl
+from thinkmark.utils.url import url_to_filename
+
+
+class TestHtmlSaverPipeline:
+    """Test cases for saving crawled pages in the background."""
+
+    @pytest.fixture
+    def spider(self, tmp_path):
+        """Create a spider whose settings point the output at tmp_path."""
+        spider = MagicMock()
+        spider.settings.get.return_value = str(tmp_path)
+        return spider
+
+    @pytest.fixture
+    def pipeline(self, spider):
+        """Create a pipeline opened for the spider."""
+        pipeline = HtmlSaverPipeline()
+        pipeline.open_spider(spider)
+        return pipeline
+
+    def _page(self, url, html, parent="ROOT"):
+        """Build a page item for url."""
+        return PageItem(url=url, depth=0, parent=parent, title=url, html=html)
+
+    def test_same_file_last_write_wins(self, pipeline, spider, tmp_path):
+        """Test that URLs normalizing to one file keep the last body written."""
+        pipeline.process_item(self._page("https://example.com/docs/guide", b"first"), spider)
+        pipeline.process_item(self._page("https://example.com/docs/guide/", b"second"), spider)
+        pipeline.close_spider(spider)
+
+        filepath = tmp_path / "raw_html" / url_to_filename("https://example.com/docs/guide")
+        assert filepath.read_bytes() == b"second"
+        assert pipeline._pending_writes == {}
+
+    def test_failed_write_dropped_from_metadata(self, pipeline, spider, tmp_path):
+        """Test that pages whose HTML could not be written are left out of the maps."""
+        good = "https://example.com/docs/good"
+        bad = "https://example.com/docs/bad"
+        # A directory where the file should go makes the write fail
+        (tmp_path / "raw_html" / url_to_filename(bad)).mkdir()
+
+        pipeline.process_item(self._page(good, b"<html>good</html>"), spider)
+        pipeline.process_item(self._page(bad, b"<html>bad</html>", parent=good), spider)
+        pipeline.close_spider(spider)
+
+        assert [entry["url"] for entry in load_jsonl(tmp_path / "urls_map.jsonl")] == [good]
+        assert list(load_json(tmp_path / "page_info.json")) == [good]
+        assert load_json(tmp_path / "parent_map.json") == {}
+        spider.logger.error.assert_called_once()
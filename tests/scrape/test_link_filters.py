@@ -0,0 +1,118 @@
+from urllib.parse import urlparse
+
+import pytest
+
+from thinkmark.scrape.link_filters import (
+    _url_path,
+    compile_alternation,
+    is_html_doc,
+    should_follow_url,
+    should_skip_url,
+)
+
+
+class TestUrlPath:
+    """Test cases for the fast URL path extractor."""
+
+    @pytest.mark.parametrize("url", [
+        "https://docs.example.com/en/latest/guide.html",
+        "https://docs.example.com",
+        "https://docs.example.com/",
+        "http://example.com:8080/api/v1/?page=2#intro",
+        "https://example.com?next=/a/b",
+        "https://example.com#/a/b",
+        "https://user@example.com/path;params",
+        "HTTPS://Example.com/Mixed/Case",
+        "/relative/path",
+        "mailto:docs@example.com",
+    ])
+    def test_url_path_matches_urlparse(self, url):
+        """Test that the extracted path is the same as urlparse's."""
+        assert _url_path(url) == urlparse(url).path
+
+
+class TestShouldFollowUrl:
+    """Test cases for include/exclude path rules."""
+
+    def test_should_follow_url_no_rules(self):
+        """Test that every URL is followed without rules."""
+        assert should_follow_url("https://example.com/anything", (), ())
+
+    def test_should_follow_url_exclude_wins(self):
+        """Test that excluded prefixes are rejected even when included."""
+        include = ("/docs",)
+        exclude = ("/docs/internal",)
+
+        assert should_follow_url("https://example.com/docs/guide", include, exclude)
+        assert not should_follow_url("https://example.com/docs/internal/x", include, exclude)
+        assert not should_follow_url("https://example.com/blog", include, exclude)
+
+    def test_should_follow_url_ignores_query(self):
+        """Test that a prefix in the query string does not count as the path."""
+        assert not should_follow_url("https://example.com/blog?from=/docs", ("/docs",), ())
+
+
+class TestShouldSkipUrl:
+    """Test cases for skipping source and media URLs."""
+
+    @pytest.mark.parametrize("url,expected", [
+        ("https://example.com/docs/guide.html", False),
+        ("https://example.com/docs/", False),
+        ("https://example.com/_sources/guide.rst.txt", True),
+        ("https://example.com/docs/logo.PNG", True),
+        ("https://example.com/docs/page.md.txt", True),
+    ])
+    def test_should_skip_url(self, url, expected):
+        """Test that source and media files are skipped and pages are kept."""
+        assert should_skip_url(url) is expected
+
+    @pytest.mark.parametrize("url,expected", [
+        ("https://example.com/docs/guide.html", False),
+        ("https://example.com/docs/", False),
+        ("https://example.com/docs/guide", True),
+        ("https://example.com/docs/guide.php?next=/a.html", True),
+    ])
+    def test_should_skip_url_restricted_extensions(self, url, expected):
+        """Test that without "" only paths with an allowed suffix are kept."""
+        assert should_skip_url(url, (".html", "/")) is expected
+
+
+class TestIsHtmlDoc:
+    """Test cases for recognizing HTML document URLs."""
+
+    def test_is_html_doc_any_path_by_default(self):
+        """Test that every path counts as HTML with the default extensions."""
+        assert is_html_doc("https://example.com/docs/guide")
+        assert is_html_doc("https://example.com/docs/api.php")
+
+    def test_is_html_doc_restricted_extensions(self):
+        """Test that without "" the path suffix decides, ignoring the query."""
+        allowed = (".html", "/")
+
+        assert is_html_doc("https://example.com/docs/guide.html", allowed)
+        assert is_html_doc("https://example.com/docs/", allowed)
+        assert not is_html_doc("https://example.com/docs/guide", allowed)
+        assert not is_html_doc("https://example.com/docs/api.php?page=a.html", allowed)
+
+
+class TestCompileAlternation:
+    """Test cases for combining LinkExtractor patterns."""
+
+    def test_compile_alternation_empty(self):
+        """Test that no patterns gives no compiled patterns."""
+        assert compile_alternation([]) == ()
+
+    def test_compile_alternation_matches_any(self):
+        """Test that the combined pattern matches when any original matches."""
+        (pattern,) = compile_alternation([r"/_static/", r"/raw/", r"/_static/", r"^/v\d+/"])
+
+        assert pattern.search("/docs/_static/app.css")
+        assert pattern.search("/v2/guide")
+        assert not pattern.search("/docs/v2/guide")
+
+    def test_compile_alternation_inline_flags(self):
+        """Test that patterns with global inline flags are kept separate."""
+        patterns = compile_alternation([r"(?i)/BLOG", r"/raw/"])
+
+        assert len(patterns) == 2
+        assert patterns[0].search("/blog/post")
@@ -0,0 +1,112 @@
+import json
+
+import pytest
+
+from thinkmark.utils.json_io import load_json, load_jsonl, save_json, save_jsonl
+
+
+class TestSaveJson:
+    """Test cases for JSON saving."""
+
+    @pytest.fixture
+    def hierarchy(self):
+        """Create a small page hierarchy for testing."""
+        return {
+            "title": "Dökumentation",
+            "url": "https://example.com/",
+            "children": [
+                {"title": "Guide \"quoted\"", "url": "https://example.com/guide", "children": []},
+                {"title": "API", "url": "https://example.com/api", "children": [], "extra": None},
+            ],
+        }
+
+    def test_save_json_pretty_matches_stdlib(self, tmp_path, hierarchy):
+        """Test that pretty output is formatted exactly like json.dump(indent=2)."""
+        path = tmp_path / "page_hierarchy.json"
+        save_json(hierarchy, path)
+
+        expected = json.dumps(hierarchy, indent=2, ensure_ascii=False)
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_save_json_round_trip(self, tmp_path, hierarchy):
+        """Test that saved data loads back unchanged."""
+        path = tmp_path / "nested" / "page_hierarchy.json"
+        save_json(hierarchy, path)
+
+        assert load_json(path) == hierarchy
+
+    def test_save_json_non_string_keys(self, tmp_path):
+        """Test that data only the stdlib encoder accepts is still saved."""
+        path = tmp_path / "counts.json"
+        save_json({1: "one", 2: "two"}, path)
+
+        assert load_json(path) == {"1": "one", "2": "two"}
+
+    def test_save_json_non_finite_floats(self, tmp_path):
+        """Test that non-finite and large floats are written exactly like json.dump."""
+        data = {"nan": float("nan"), "inf": float("inf"), "big": 1e16}
+        path = tmp_path / "scores.json"
+        save_json(data, path)
+
+        assert path.read_text(encoding="utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+
+    def test_save_json_compact(self, tmp_path, hierarchy):
+        """Test non-pretty output."""
+        path = tmp_path / "compact.json"
+        save_json(hierarchy, path, pretty=False)
+
+        assert path.read_text(encoding="utf-8") == json.dumps(hierarchy, ensure_ascii=False)
+
+
+class TestLoadJson:
+    """Test cases for JSON loading."""
+
+    def test_load_json_unicode(self, tmp_path):
+        """Test that UTF-8 content written by json.dump loads back unchanged."""
+        data = {"title": "Dökumentation – Übersicht", "children": []}
+        path = tmp_path / "page_hierarchy.json"
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+        assert load_json(path) == data
+
+    def test_load_json_non_finite_and_big_values(self, tmp_path):
+        """Test that NaN and integers beyond 64 bits load."""
+        path = tmp_path / "scores.json"
+        path.write_text('{"score": NaN, "big": 123456789012345678901234567890}', encoding="utf-8")
+
+        data = load_json(path)
+        assert data["score"] != data["score"]
+        assert data["big"] == 123456789012345678901234567890
+
+    def test_load_json_invalid(self, tmp_path):
+        """Test that malformed JSON still raises a JSONDecodeError."""
+        path = tmp_path / "broken.json"
+        path.write_text('{"title": ', encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            load_json(path)
+
+
+class TestLoadJsonl:
+    """Test cases for JSONL loading."""
+
+    def test_load_jsonl_round_trip(self, tmp_path):
+        """Test that records saved by save_jsonl load back unchanged and in order."""
+        records = [
+            {"url": "https://example.com/", "file": "raw_html/example-com.html", "title": "Dökumentation"},
+            {"url": "https://example.com/api", "file": "raw_html/example-com-api.html", "title": None},
+            {"url": "https://example.com/sep", "file": "raw_html/example-com-sep.html", "title": "A\u2028B"},
+        ]
+        path = tmp_path / "urls_map.jsonl"
+        save_jsonl(records, path)
+
+        assert load_jsonl(path) == records
+
+    def test_load_jsonl_non_finite_values(self, tmp_path):
+        """Test that lines containing NaN load."""
+        path = tmp_path / "scores.jsonl"
+        path.write_text('{"score": 1}\n{"score": NaN}\n', encoding="utf-8")
+
+        items = load_jsonl(path)
+        assert items[0] == {"score": 1}
+        assert items[1]["score"] != items[1]["score"]
@@ -5,7 +5,8 @@ from thinkmark.utils.url import (
     normalize_url,
     is_url_allowed,
     url_to_filename,
-    get_site_directory
+    get_site_directory,
+    _cached_slugify
 )
 
 
@@ -179,6 +180,13 @@ class TestIsUrlAllowed:
 class TestUrlToFilename:
     """Test cases for URL to filename conversion."""
     
+    @pytest.fixture(autouse=True)
+    def clear_slug_cache(self):
+        """Make sure each test sees its own patched slugify."""
+        _cached_slugify.cache_clear()
+        yield
+        _cached_slugify.cache_clear()
+    
     @patch('thinkmark.utils.url.slugify')
     def test_url_to_filename_basic(self, mock_slugify):
         """Test basic URL to filename conversion."""
@@ -188,7 +196,8 @@ class TestUrlToFilename:
         result = url_to_filename(url)
         
         assert result == "example-com-page.html"
-        assert mock_slugify.call_count == 2
+        # "page" is already a slug, so only the domain goes through slugify
+        assert mock_slugify.call_count == 1
     
     @patch('thinkmark.utils.url.slugify')
     def test_url_to_filename_directory(self, mock_slugify):
@@ -240,6 +249,26 @@ class TestUrlToFilename:
         result = url_to_filename(url)
         
         assert result == "example-com-path.html"
+    
+    @patch('thinkmark.utils.url.slugify')
+    def test_url_to_filename_reuses_domain_slug(self, mock_slugify):
+        """Test that the domain is only slugified once across pages."""
+        mock_slugify.side_effect = lambda x: x.lower().replace('.', '-')
+        
+        assert url_to_filename("https://example.com/A") == "example-com-a.html"
+        assert url_to_filename("https://example.com/B") == "example-com-b.html"
+        assert mock_slugify.call_count == 3
+    
+    @patch('thinkmark.utils.url.slugify')
+    def test_url_to_filename_slug_paths_skip_slugify(self, mock_slugify):
+        """Test that paths already in slug form are used as they are."""
+        mock_slugify.side_effect = lambda x: x.lower().replace('.', '-')
+        
+        assert url_to_filename("https://example.com/api/v1-2/get-started") == "example-com-api-v1-2-get-started.html"
+        assert url_to_filename("https://example.com/api/Intro_Guide") == "example-com-api-intro_guide.html"
+        mock_slugify.assert_any_call("example.com")
+        mock_slugify.assert_any_call("api-Intro_Guide")
+        assert mock_slugify.call_count == 2
 
 
 class TestGetSiteDirectory: